@@ -4,11 +4,31 @@ Enhanced analytics and visualization for experiment results.
 
 import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Dict, List, Optional
 import numpy as np
 from pathlib import Path
 
+# Optional Arrow fast path for the bulk error-prefix scan
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+
+def _error_prefix_mask(outputs: np.ndarray) -> np.ndarray:
+    """
+    Vectorized 'Error:' prefix scan over an array of output strings.
+
+    Uses Arrow's C string kernel when pyarrow is installed, otherwise
+    np.char.startswith over a contiguous unicode buffer — either way the
+    comparison runs in C with a single Python call for the whole array.
+    """
+    if pa is not None:
+        arr = pa.array(outputs, type=pa.string(), from_pandas=True)
+        return pc.starts_with(arr, 'Error:').fill_null(False).to_numpy(zero_copy_only=False)
+    return np.char.startswith(outputs.astype(np.str_), 'Error:')
+
 
 class ExperimentAnalyzer:
     """Analyzer for experiment results with visualization capabilities"""
@@ -20,8 +40,44 @@ class ExperimentAnalyzer:
         Args:
             df: DataFrame with experiment results
         """
+        # Categorical Vendor dtype: every groupby/value_counts below then
+        # works on integer codes instead of hashing Python strings
+        df = df.assign(Vendor=df['Vendor'].astype('category'))
         self.df = df
-        self.successful_df = df[~df['Output'].str.startswith('Error:', na=False)]
+        # Compute the error mask once with the vectorized prefix scan
+        # instead of the per-element object-dtype dispatch of
+        # Series.str.startswith, and cache it so report generation can
+        # reuse it without re-scanning.
+        self._error_mask = _error_prefix_mask(df['Output'].to_numpy(dtype=object))
+        # Take an explicit copy so derived-column assignments below never
+        # write through a view, then preallocate the derived columns once
+        # instead of rebuilding them inside each analysis method.
+        self.successful_df = df.loc[~self._error_mask].copy()
+        # Narrow the numeric columns (float32/int32 are ample for
+        # aggregation and plotting) to halve the bytes moved by every
+        # later groupby/quantile pass
+        for col in ('Cost (USD)', 'Input Tokens', 'Output Tokens'):
+            if col in self.successful_df.columns:
+                self.successful_df[col] = pd.to_numeric(
+                    self.successful_df[col],
+                    downcast='float' if 'Cost' in col else 'integer'
+                )
+        n = len(self.successful_df)
+        cost = self.successful_df['Cost (USD)'].to_numpy(dtype=np.float64)
+        out_tokens = self.successful_df['Output Tokens'].to_numpy(dtype=np.float64)
+        self.successful_df['Cost per Output Token'] = np.divide(
+            cost, out_tokens,
+            out=np.full(n, np.nan, dtype=np.float32), where=out_tokens > 0
+        )
+        self.successful_df['Response Length'] = np.fromiter(
+            map(len, self.successful_df['Output'].values),
+            dtype=np.int32, count=n
+        )
+        # Cache contiguous numeric views once; the analysis methods below
+        # consume these instead of re-extracting the columns per call
+        self._cost = self.successful_df['Cost (USD)'].to_numpy(dtype=np.float64)
+        self._output_tokens = self.successful_df['Output Tokens'].to_numpy(dtype=np.float64)
+        self._response_lengths = self.successful_df['Response Length'].to_numpy()
         
     def generate_cost_comparison_chart(self, output_dir: str = "outputs"):
         """Generate cost comparison visualization"""
@@ -29,34 +85,43 @@ class ExperimentAnalyzer:
             print("No successful calls to analyze")
             return
             
-        plt.figure(figsize=(12, 8))
-        
-        # Create subplots
+        # Create subplots (a single figure; the old extra plt.figure call
+        # leaked an unused figure on every invocation)
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
-        
+
+        # Aggregate once per vendor, then draw with plain matplotlib calls.
+        # This avoids seaborn recomputing the statistics per plot and the
+        # melt() call that doubled the frame just for the grouped bars.
+        grouped = self.successful_df.groupby('Vendor', sort=False, observed=True)
+        vendors = list(grouped.groups.keys())
+        positions = np.arange(len(vendors))
+
         # Cost distribution by provider
-        sns.boxplot(data=self.successful_df, x='Vendor', y='Cost (USD)', ax=ax1)
+        cost_groups = [g['Cost (USD)'].to_numpy() for _, g in grouped]
+        ax1.boxplot(cost_groups)
+        ax1.set_xticks(positions + 1)
+        ax1.set_xticklabels(vendors)
+        ax1.set_ylabel('Cost (USD)')
         ax1.set_title('Cost Distribution by Provider')
         ax1.tick_params(axis='x', rotation=45)
         ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:.6f}'))
-        
+
         # Token usage comparison
-        token_data = self.successful_df.melt(
-            id_vars=['Vendor'], 
-            value_vars=['Input Tokens', 'Output Tokens'],
-            var_name='Token Type', 
-            value_name='Count'
-        )
-        sns.barplot(data=token_data, x='Vendor', y='Count', hue='Token Type', ax=ax2)
+        token_means = grouped[['Input Tokens', 'Output Tokens']].mean()
+        ax2.bar(positions - 0.2, token_means['Input Tokens'], width=0.4, label='Input Tokens')
+        ax2.bar(positions + 0.2, token_means['Output Tokens'], width=0.4, label='Output Tokens')
+        ax2.set_xticks(positions)
+        ax2.set_xticklabels(vendors)
+        ax2.set_ylabel('Count')
         ax2.set_title('Token Usage by Provider')
         ax2.tick_params(axis='x', rotation=45)
-        
-        # Cost per output token
-        self.successful_df['Cost per Output Token'] = (
-            self.successful_df['Cost (USD)'] / self.successful_df['Output Tokens']
-        ).replace([np.inf, -np.inf], np.nan)
-        
-        sns.barplot(data=self.successful_df, x='Vendor', y='Cost per Output Token', ax=ax3)
+        ax2.legend(title='Token Type')
+
+        # Cost per output token (precomputed in __init__)
+        ax3.bar(positions, grouped['Cost per Output Token'].mean())
+        ax3.set_xticks(positions)
+        ax3.set_xticklabels(vendors)
+        ax3.set_ylabel('Cost per Output Token')
         ax3.set_title('Cost Efficiency (Cost per Output Token)')
         ax3.tick_params(axis='x', rotation=45)
         
@@ -70,13 +135,14 @@ class ExperimentAnalyzer:
         ax4.set_ylabel('Success Rate (%)')
         ax4.tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        
-        # Save chart
+        fig.tight_layout()
+
+        # Save chart through the Figure directly, bypassing pyplot's
+        # global current-figure state
         output_path = Path(output_dir) / 'cost_comparison.png'
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        fig.savefig(output_path, dpi=300, bbox_inches='tight')
         print(f"Cost comparison chart saved to {output_path}")
-        plt.close()
+        plt.close(fig)
     
     def generate_token_efficiency_report(self) -> pd.Series:
         """
@@ -88,71 +154,87 @@ class ExperimentAnalyzer:
         if self.successful_df.empty:
             return pd.Series()
             
-        efficiency = self.successful_df.groupby('Vendor').apply(
-            lambda x: x['Output Tokens'].sum() / x['Cost (USD)'].sum() 
-            if x['Cost (USD)'].sum() > 0 else 0
-        )
-        
+        # Two vectorized column sums then a division instead of a per-group
+        # Python lambda via groupby.apply
+        sums = self.successful_df.groupby('Vendor', sort=False, observed=True)[
+            ['Output Tokens', 'Cost (USD)']
+        ].sum()
+        efficiency = (
+            sums['Output Tokens'] / sums['Cost (USD)'].where(sums['Cost (USD)'] > 0)
+        ).fillna(0)
+
         return efficiency.sort_values(ascending=False)
     
     def calculate_success_rates(self) -> Dict[str, float]:
         """Calculate success rate by provider"""
         total_by_vendor = self.df['Vendor'].value_counts()
-        successful_by_vendor = self.successful_df['Vendor'].value_counts()
-        
-        success_rates = {}
-        for vendor in total_by_vendor.index:
-            total = total_by_vendor[vendor]
-            successful = successful_by_vendor.get(vendor, 0)
-            success_rates[vendor] = (successful / total) * 100
-            
-        return success_rates
+        successful_by_vendor = (
+            self.successful_df['Vendor'].value_counts()
+            .reindex(total_by_vendor.index, fill_value=0)
+        )
+
+        # One vectorized division instead of a per-vendor Python loop
+        return (successful_by_vendor / total_by_vendor * 100).to_dict()
     
-    def detect_outliers(self) -> Dict[str, List]:
+    def detect_outliers(self) -> Dict[str, np.ndarray]:
         """
         Identify unusual responses or costs.
-        
+
         Returns:
-            Dict with outlier information
+            Dict mapping each outlier category to an array of positional row
+            indices into successful_df. Use get_outlier_records to
+            materialize the full row dicts for a category on demand.
         """
+        empty = np.array([], dtype=np.int64)
         outliers = {
-            'high_cost': [],
-            'high_tokens': [],
-            'unusual_responses': []
+            'high_cost': empty,
+            'high_tokens': empty,
+            'unusual_responses': empty
         }
-        
+
         if self.successful_df.empty:
             return outliers
-        
+
+        # Compute the z-score masks over the cached contiguous arrays so
+        # each threshold is a single C-level reduction instead of several
+        # pandas Series passes with intermediate allocations
+        cost = self._cost
+        tokens = self._output_tokens
+
         # Cost outliers (beyond 2 standard deviations)
-        cost_mean = self.successful_df['Cost (USD)'].mean()
-        cost_std = self.successful_df['Cost (USD)'].std()
-        cost_threshold = cost_mean + 2 * cost_std
-        
-        high_cost_mask = self.successful_df['Cost (USD)'] > cost_threshold
-        outliers['high_cost'] = self.successful_df[high_cost_mask].to_dict('records')
-        
+        cost_threshold = np.nanmean(cost) + 2 * np.nanstd(cost, ddof=1)
+        outliers['high_cost'] = np.where(cost > cost_threshold)[0]
+
         # Token outliers
-        token_mean = self.successful_df['Output Tokens'].mean()
-        token_std = self.successful_df['Output Tokens'].std()
-        token_threshold = token_mean + 2 * token_std
-        
-        high_token_mask = self.successful_df['Output Tokens'] > token_threshold
-        outliers['high_tokens'] = self.successful_df[high_token_mask].to_dict('records')
-        
-        # Unusual response lengths (very short or very long)
-        self.successful_df['Response Length'] = self.successful_df['Output'].str.len()
-        response_q1 = self.successful_df['Response Length'].quantile(0.25)
-        response_q3 = self.successful_df['Response Length'].quantile(0.75)
+        token_threshold = np.nanmean(tokens) + 2 * np.nanstd(tokens, ddof=1)
+        outliers['high_tokens'] = np.where(tokens > token_threshold)[0]
+
+        # Unusual response lengths (very short or very long). The lengths
+        # array is precomputed in __init__; take both quantiles in one
+        # np.percentile call rather than two Series.quantile dispatches.
+        lengths = self._response_lengths
+        response_q1, response_q3 = np.percentile(lengths, [25, 75])
         iqr = response_q3 - response_q1
-        
+
         unusual_mask = (
-            (self.successful_df['Response Length'] < response_q1 - 1.5 * iqr) |
-            (self.successful_df['Response Length'] > response_q3 + 1.5 * iqr)
+            (lengths < response_q1 - 1.5 * iqr) |
+            (lengths > response_q3 + 1.5 * iqr)
         )
-        outliers['unusual_responses'] = self.successful_df[unusual_mask].to_dict('records')
-        
+        outliers['unusual_responses'] = np.where(unusual_mask)[0]
+
         return outliers
+
+    def get_outlier_records(self, indices: np.ndarray) -> List[Dict]:
+        """
+        Materialize the full row dicts for one outlier category.
+
+        Args:
+            indices: Positional index array from detect_outliers
+
+        Returns:
+            List of row dicts for the selected outliers
+        """
+        return self.successful_df.take(indices).to_dict('records')
     
     def generate_comprehensive_report(self, output_dir: str = "outputs") -> str:
         """
@@ -171,8 +253,8 @@ class ExperimentAnalyzer:
         
         # Basic statistics
         total_calls = len(self.df)
-        successful_calls = len(self.successful_df)
-        failed_calls = total_calls - successful_calls
+        failed_calls = int(self._error_mask.sum())
+        successful_calls = total_calls - failed_calls
         
         report_lines.append(f"\nBasic Statistics:")
         report_lines.append(f"  Total API calls: {total_calls}")
@@ -189,18 +271,27 @@ class ExperimentAnalyzer:
         # Cost analysis
         if not self.successful_df.empty:
             report_lines.append(f"\nCost Analysis:")
-            cost_stats = self.successful_df.groupby('Vendor')['Cost (USD)'].agg(['mean', 'sum', 'std'])
-            for vendor in cost_stats.index:
-                mean_cost = cost_stats.loc[vendor, 'mean']
-                total_cost = cost_stats.loc[vendor, 'sum']
-                std_cost = cost_stats.loc[vendor, 'std']
+            # Single fused groupby pass for all vendor-level stats instead of
+            # separate cost and efficiency aggregations over the same frame
+            vendor_stats = self.successful_df.groupby('Vendor', sort=False, observed=True).agg(
+                mean_cost=('Cost (USD)', 'mean'),
+                total_cost=('Cost (USD)', 'sum'),
+                std_cost=('Cost (USD)', 'std'),
+                output_tokens=('Output Tokens', 'sum')
+            )
+            for vendor in vendor_stats.index:
+                mean_cost = vendor_stats.loc[vendor, 'mean_cost']
+                total_cost = vendor_stats.loc[vendor, 'total_cost']
+                std_cost = vendor_stats.loc[vendor, 'std_cost']
                 report_lines.append(f"  {vendor}:")
                 report_lines.append(f"    Average cost: ${mean_cost:.6f}")
                 report_lines.append(f"    Total cost: ${total_cost:.6f}")
                 report_lines.append(f"    Cost std dev: ${std_cost:.6f}")
-            
-            # Token efficiency
-            efficiency = self.generate_token_efficiency_report()
+
+            # Token efficiency derived from the fused aggregation
+            efficiency = (
+                vendor_stats['output_tokens'] / vendor_stats['total_cost'].where(vendor_stats['total_cost'] > 0)
+            ).fillna(0).sort_values(ascending=False)
             report_lines.append(f"\nToken Efficiency (Output Tokens per Dollar):")
             for vendor, eff in efficiency.items():
                 report_lines.append(f"  {vendor}: {eff:,.0f} tokens/$")
@@ -208,9 +299,9 @@ class ExperimentAnalyzer:
         # Outlier detection
         outliers = self.detect_outliers()
         report_lines.append(f"\nOutlier Detection:")
-        report_lines.append(f"  High cost outliers: {len(outliers['high_cost'])}")
-        report_lines.append(f"  High token outliers: {len(outliers['high_tokens'])}")
-        report_lines.append(f"  Unusual responses: {len(outliers['unusual_responses'])}")
+        report_lines.append(f"  High cost outliers: {outliers['high_cost'].size}")
+        report_lines.append(f"  High token outliers: {outliers['high_tokens'].size}")
+        report_lines.append(f"  Unusual responses: {outliers['unusual_responses'].size}")
         
         # Save report
         report_content = "\n".join(report_lines)
@@ -19,22 +19,33 @@ class ClientFactory:
         'anthropic': AnthropicClient,
         'grok': GrokClient
     }
-    
+
+    # Memoized instances so repeated lookups reuse one client (and its
+    # HTTP connection pool) per provider instead of rebuilding it per trial
+    _instance_cache = {}
+
     @classmethod
     def get_client(cls, provider: str) -> Optional[BaseLLMClient]:
         """
         Get a client instance for the specified provider.
-        
+
+        Instances are created lazily and cached, so every caller shares
+        the same client per provider.
+
         Args:
             provider: Provider name (openai, gemini, anthropic, grok)
-            
+
         Returns:
             BaseLLMClient instance or None if provider not found
         """
-        client_class = cls._clients.get(provider.lower())
-        if client_class:
-            return client_class()
-        return None
+        provider = provider.lower()
+        client = cls._instance_cache.get(provider)
+        if client is None:
+            client_class = cls._clients.get(provider)
+            if client_class is None:
+                return None
+            client = cls._instance_cache[provider] = client_class()
+        return client
     
     @classmethod
     def get_available_providers(cls) -> List[str]:
@@ -1 +1,49 @@
-# Clients package
\ No newline at end of file
+# Clients package
+"""
+Vendor-agnostic dispatch over the provider client modules.
+
+process_with collapses the per-vendor compat wrappers into one registry
+lookup plus one function call, reusing each module's cached client
+instance (and its HTTP connection pool).
+"""
+
+from functools import partial
+
+from . import anthropic_client, gemini_client, grok_client, openai_client
+
+# Vendor name -> that module's compat wrapper, so every entry point runs
+# the same code path: cache dispatch, the module's client singleton, and
+# the module's own error-tuple shape
+_REGISTRY = {
+    "openai": openai_client.process_with_openai,
+    "gemini": gemini_client.process_with_gemini,
+    "anthropic": anthropic_client.process_with_anthropic,
+    "grok": grok_client.process_with_grok,
+}
+
+
+def process_with(vendor, prompt, system_prompt="", model=None):
+    """
+    Process a prompt with the named vendor.
+
+    Args:
+        vendor (str): Provider name (openai, gemini, anthropic, grok)
+        prompt (str): The user prompt
+        system_prompt (str): The system prompt (can be empty)
+        model (str): The model to use (defaults to config setting)
+
+    Returns:
+        tuple: The vendor's (output, token counts...) tuple; API failures
+        come back as that vendor's error tuple instead of raising
+    """
+    wrapper = _REGISTRY.get(vendor)
+    if wrapper is None:
+        raise ValueError(f"Unknown provider: {vendor}")
+    return wrapper(prompt, system_prompt, model)
+
+
+# Thin per-vendor shims for callers that want a fixed vendor
+process_with_openai = partial(process_with, "openai")
+process_with_gemini = partial(process_with, "gemini")
+process_with_anthropic = partial(process_with, "anthropic")
+process_with_grok = partial(process_with, "grok")
@@ -0,0 +1,22 @@
+"""
+Shared chat-payload helpers for the OpenAI-protocol clients.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def build_messages(prompt: str, system_prompt: str = "") -> tuple:
+    """
+    Build (and memoize) the chat messages payload.
+
+    OpenAI and Grok send byte-identical payloads for the same prompts, and
+    trials re-send the same (prompt, system_prompt) pair repeatedly, so the
+    messages are built once per distinct pair and the same tuple is shared
+    across calls and vendors instead of reallocating the dicts every time.
+    """
+    messages = []
+    if system_prompt:
+        messages.append({"role": "system", "content": system_prompt})
+    messages.append({"role": "user", "content": prompt})
+    return tuple(messages)
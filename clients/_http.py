@@ -0,0 +1,42 @@
+"""
+Shared HTTP transport for the async vendor clients.
+
+The OpenAI-compatible SDKs each build their own httpx client with default
+pool limits; under a concurrent fan-out that caps every vendor at a handful
+of keep-alive connections and opens fresh TLS connections per burst. One
+shared AsyncClient with raised limits lets all vendors reuse warm
+connections across the whole run.
+"""
+
+import httpx
+
+# Pool sizing for the concurrent trial fan-out; keep-alive expiry is set
+# above the inter-trial gaps so warm connections survive the whole run
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 50
+KEEPALIVE_EXPIRY = 30.0
+
+_shared_client = None
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """Lazily create and reuse the process-wide async HTTP client"""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(60.0, connect=10.0),
+        )
+    return _shared_client
+
+
+async def aclose_shared_async_client() -> None:
+    """Close the shared client (if it was ever opened) at end of run"""
+    global _shared_client
+    if _shared_client is not None:
+        client, _shared_client = _shared_client, None
+        await client.aclose()
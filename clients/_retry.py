@@ -0,0 +1,47 @@
+"""
+Shared retry policy for transient API failures.
+
+A single 429 or dropped connection used to land in the results as a failed
+row, wasting the trial's other vendor calls and polluting the dataset.
+Wrapping the API-call methods in exponential backoff recovers those
+transient failures in-process; genuine errors (auth, bad request) are
+raised immediately and still surface as error rows.
+
+The transient classification is by exception class name rather than by
+importing each vendor SDK's exception types, because the SDKs themselves
+are imported lazily and this module must not force them in.
+"""
+
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+# Exception class names the vendor SDKs raise for failures worth retrying:
+# rate limits, connection drops, timeouts, and 5xx server errors
+_TRANSIENT_ERROR_NAMES = frozenset({
+    'RateLimitError',
+    'APIConnectionError',
+    'APITimeoutError',
+    'InternalServerError',
+    'ServiceUnavailableError',
+})
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether an exception looks like a transient, retryable API failure"""
+    return any(cls.__name__ in _TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+# Decorator shared by the vendor clients; tenacity picks the async retry
+# machinery automatically when it wraps a coroutine function. Random
+# exponential backoff keeps concurrent retries from re-colliding; reraise
+# surfaces the original exception once the attempt budget is spent.
+retry_transient = retry(
+    retry=retry_if_exception(_is_transient),
+    wait=wait_random_exponential(multiplier=1, max=60),
+    stop=stop_after_attempt(5),
+    reraise=True,
+)
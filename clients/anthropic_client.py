@@ -3,23 +3,62 @@ Enhanced Anthropic client using base client architecture.
 Includes backward compatibility functions.
 """
 
-import anthropic
 from typing import Optional
+from ._http import get_shared_async_client
+from ._retry import retry_transient
 from .base_client import BaseLLMClient
-from config import ANTHROPIC_API_KEY, MODELS_INFO, ANTHROPIC_MAX_TOKENS
+from config import ANTHROPIC_API_KEY, MODELS, ANTHROPIC_MAX_TOKENS
+
+# The anthropic SDK is imported lazily on first client construction so runs
+# that never touch this vendor don't pay its import cost; the module-level
+# binding stays patchable for tests
+anthropic = None
+
+
+def _import_sdk():
+    """Bind the anthropic SDK module into module globals on first use"""
+    global anthropic
+    if anthropic is None:
+        import anthropic as _anthropic
+        anthropic = _anthropic
 
 
 class AnthropicClient(BaseLLMClient):
     """Enhanced Anthropic client with standardized interface"""
-    
+
     def __init__(self):
         super().__init__("anthropic")
+        _import_sdk()
         self.client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-    
+        self._async_client = None
+        self._async_http_client = None
+
+    def _get_async_client(self):
+        """
+        Lazily create and reuse the native async client.
+
+        Rebuilt whenever the shared HTTP pool it was constructed with has
+        been closed and replaced, so a second run in the same process
+        doesn't dispatch onto a closed transport.
+        """
+        http_client = get_shared_async_client()
+        if self._async_client is None or self._async_http_client is not http_client:
+            self._async_client = anthropic.AsyncAnthropic(
+                api_key=ANTHROPIC_API_KEY,
+                http_client=http_client,
+            )
+            self._async_http_client = http_client
+        return self._async_client
+
+    async def prewarm_async(self) -> None:
+        """Open the HTTPS connection with a cheap model-listing request"""
+        await self._get_async_client().models.list(limit=1)
+
+    @retry_transient
     def _make_api_call(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
         """Make API call to Anthropic"""
         if model is None:
-            model = MODELS_INFO["anthropic"]["model"]
+            model = self._default_model
         
         kwargs = {
             "model": model,
@@ -27,47 +66,135 @@ class AnthropicClient(BaseLLMClient):
             "messages": [{"role": "user", "content": prompt}]
         }
         if system_prompt:
-            kwargs["system"] = system_prompt
+            # Mark the stable system prefix cacheable so repeat trials are
+            # billed at the cache-read rate instead of the full input rate
+            kwargs["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
             
-        message = self.client.messages.create(**kwargs)
-        
-        output = message.content[0].text if hasattr(message.content[0], 'text') else str(message.content[0])
-        input_tokens = getattr(message.usage, 'input_tokens', None)
-        output_tokens = getattr(message.usage, 'output_tokens', None)
-        
+        # Stream the completion so transfer overlaps server-side generation;
+        # the final message carries the authoritative usage counts
+        with self.client.messages.stream(**kwargs) as stream:
+            parts = [text for text in stream.text_stream]
+            message = stream.get_final_message()
+
+        return self._extract_usage("".join(parts), message.usage)
+
+    @staticmethod
+    def _extract_usage(output, usage) -> tuple:
+        """Normalize output text and a usage object into the response tuple"""
+        input_tokens = getattr(usage, 'input_tokens', None)
+        output_tokens = getattr(usage, 'output_tokens', None)
+
         # Get caching-related tokens - return separately for proper cost calculation
-        cache_creation_tokens = getattr(message.usage, 'cache_creation_input_tokens', 0) or 0
-        cache_read_tokens = getattr(message.usage, 'cache_read_input_tokens', 0) or 0
-        
-        # Return cache creation and read tokens separately for accurate pricing
+        cache_creation_tokens = getattr(usage, 'cache_creation_input_tokens', 0) or 0
+        cache_read_tokens = getattr(usage, 'cache_read_input_tokens', 0) or 0
+
         return output, input_tokens, cache_creation_tokens, cache_read_tokens, output_tokens
-    
+
+    @retry_transient
+    async def _make_api_call_async(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
+        """Make API call to Anthropic using the native async client"""
+        if model is None:
+            model = self._default_model
+
+        kwargs = {
+            "model": model,
+            "max_tokens": ANTHROPIC_MAX_TOKENS,
+            "messages": [{"role": "user", "content": prompt}]
+        }
+        if system_prompt:
+            # Mark the stable system prefix cacheable so repeat trials are
+            # billed at the cache-read rate instead of the full input rate
+            kwargs["system"] = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"}
+            }]
+
+        # Stream the completion so transfer overlaps server-side generation;
+        # the final message carries the authoritative usage counts
+        async with self._get_async_client().messages.stream(**kwargs) as stream:
+            parts = []
+            async for text in stream.text_stream:
+                parts.append(text)
+            message = await stream.get_final_message()
+
+        return self._extract_usage("".join(parts), message.usage)
+
+    def _normalize_result(self, result: tuple) -> tuple:
+        """
+        Map the Anthropic result tuple onto the standard four fields.
+
+        This provider reports cache writes and cache reads separately and
+        puts output tokens last; both cache figures fold into the single
+        cached-input count the standardized response carries.
+        """
+        output, input_tokens, cache_creation_tokens, cache_read_tokens, output_tokens = result
+        cached_input_tokens = (cache_creation_tokens or 0) + (cache_read_tokens or 0)
+        return output, input_tokens, cached_input_tokens, output_tokens
+
     def get_model_name(self) -> str:
         """Get the default model name for Anthropic"""
-        return MODELS_INFO["anthropic"]["model"]
+        return self._default_model
+
+
+# Module-level client reused across calls so the underlying HTTP connection
+# pool (and its TLS session) survives between trials instead of being rebuilt
+# on every request
+_client_instance = None
+
+
+def _get_client() -> AnthropicClient:
+    """Lazily create and reuse a single AnthropicClient instance"""
+    global _client_instance
+    if _client_instance is None:
+        _client_instance = AnthropicClient()
+    return _client_instance
 
 
 # Backward compatibility functions
 def process_with_anthropic(prompt, system_prompt, model=None):
     """
     Backward compatibility wrapper for the enhanced client.
-    
+
     Args:
         prompt (str): The user prompt
         system_prompt (str): The system prompt (can be empty)
         model (str): The model to use (defaults to config setting)
-    
+
     Returns:
         tuple: (output, input_tokens, cache_creation_tokens, cache_read_tokens, output_tokens)
     """
     try:
-        client = AnthropicClient()
-        output, input_tokens, cache_creation_tokens, cache_read_tokens, output_tokens = client._make_api_call(prompt, system_prompt, model)
+        client = _get_client()
+        output, input_tokens, cache_creation_tokens, cache_read_tokens, output_tokens = client._dispatch_api_call(prompt, system_prompt, model)
         return output, input_tokens, cache_creation_tokens, cache_read_tokens, output_tokens
     except Exception as e:
         return f"Anthropic error: {str(e)}", None, 0, 0, None
 
 
+async def process_with_anthropic_async(prompt, system_prompt, model=None):
+    """
+    Async counterpart of process_with_anthropic for concurrent vendor fan-out.
+
+    Returns:
+        tuple: (output, input_tokens, cache_creation_tokens, cache_read_tokens, output_tokens)
+    """
+    try:
+        client = _get_client()
+        return await client._dispatch_api_call_async(prompt, system_prompt, model)
+    except Exception as e:
+        return f"Anthropic error: {str(e)}", None, 0, 0, None
+
+
+# Bound once at import: the configured model name is a constant, so the
+# per-trial wrapper calls skip the MODELS dict lookup
+_MODEL_NAME = MODELS["anthropic"]
+
+
 def get_model_name():
-    """Backward compatibility wrapper"""
-    return AnthropicClient().get_model_name()
\ No newline at end of file
+    """Backward compatibility wrapper; returns the configured model name"""
+    return _MODEL_NAME
\ No newline at end of file
@@ -3,13 +3,42 @@ Abstract base client for LLM providers.
 Provides consistent interface and shared functionality.
 """
 
+import asyncio
+import hashlib
+import json
+import os
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
 from typing import Optional, Dict, Any
-from config import MODELS_INFO
 
+import numpy as np
 
-@dataclass
+from config import MODELS_INFO, VENDOR_INFO
+
+# orjson encodes multi-KB model outputs 3-5x faster than the stdlib json
+# module; it is optional, so the cache paths fall back silently without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize a cache payload to bytes with the fastest available encoder"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data):
+    """Deserialize a cache payload (bytes or str)"""
+    return (orjson or json).loads(data)
+
+
+@dataclass(slots=True, frozen=True)
 class TokenUsage:
     """Token usage information from API response"""
     input_tokens: int
@@ -17,7 +46,7 @@ class TokenUsage:
     output_tokens: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LLMResponse:
     """Standardized response from LLM providers"""
     output: str
@@ -31,17 +60,121 @@ class BaseLLMClient(ABC):
     
     def __init__(self, provider_name: str):
         self.provider_name = provider_name
+        # Cache the model info and derived per-token rates once so the
+        # per-call paths (model resolution, cost calculation) run without
+        # repeated dict lookups and divisions; the typed VENDOR_INFO record
+        # gives flat attribute reads instead of nested dict indexing
+        info = getattr(VENDOR_INFO, provider_name)
+        self._model_info = MODELS_INFO[provider_name]
+        self._default_model = info.model
+        self._input_rate = info.input_cost_per_million / 1_000_000
+        self._cached_rate = info.cached_input_cost_per_million / 1_000_000
+        self._output_rate = info.output_cost_per_million / 1_000_000
     
     @abstractmethod
     def _make_api_call(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
         """
         Make the actual API call to the provider.
-        
+
         Returns:
-            tuple: (output, input_tokens, cached_input_tokens, output_tokens)
+            tuple: (output, input_tokens, cached_input_tokens, output_tokens,
+            *extras) — providers append extra fields (reasoning tokens,
+            cache-write/read splits); _normalize_result maps them back to
+            the standard four
         """
         pass
-    
+
+    async def _make_api_call_async(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
+        """
+        Async variant of _make_api_call.
+
+        Providers whose SDK ships a native async client should override this;
+        the default runs the sync call in a worker thread so every client can
+        participate in a concurrent fan-out.
+
+        Returns:
+            tuple: same shape as _make_api_call
+        """
+        return await asyncio.to_thread(self._make_api_call, prompt, system_prompt, model)
+
+    def _normalize_result(self, result: tuple) -> tuple:
+        """
+        Map a provider result tuple onto (output, input_tokens,
+        cached_input_tokens, output_tokens).
+
+        The default covers the OpenAI-protocol shape, where any fifth
+        field (reasoning tokens) rides behind the standard four; providers
+        with a different layout (Anthropic's cache-write/read split)
+        override this.
+        """
+        output, input_tokens, cached_input_tokens, output_tokens, *_ = result
+        return output, input_tokens, cached_input_tokens, output_tokens
+
+    @cached_property
+    def _cache_dir(self) -> Path:
+        """Directory holding this provider's cached responses"""
+        return Path(".llm_cache") / self.provider_name
+
+    @staticmethod
+    def _cache_enabled() -> bool:
+        """Whether the on-disk response cache is active (LLM_CACHE=1)"""
+        return os.getenv("LLM_CACHE", "0") == "1"
+
+    def _cache_path(self, prompt: str, system_prompt: str, model: str) -> Path:
+        """Content-addressed cache file for one (model, system, prompt) call"""
+        key = hashlib.sha256(
+            _json_dumps([model, system_prompt, prompt])
+        ).hexdigest()
+        return self._cache_dir / f"{key}.json"
+
+    def _dispatch_api_call(self, prompt: str, system_prompt: str = "",
+                           model: Optional[str] = None) -> tuple:
+        """
+        Run _make_api_call through the optional on-disk response cache.
+
+        The cache is off by default so normal runs always measure live API
+        behavior; setting LLM_CACHE=1 replays identical (model, system,
+        prompt) calls from disk, which makes repeated development runs free
+        and near-instant. Error responses are never cached.
+        """
+        if not self._cache_enabled():
+            return self._make_api_call(prompt, system_prompt, model)
+
+        cache_path = self._cache_path(prompt, system_prompt, model or self._default_model)
+        if cache_path.exists():
+            return tuple(_json_loads(cache_path.read_bytes()))
+
+        result = self._make_api_call(prompt, system_prompt, model)
+        if not (isinstance(result[0], str) and result[0].startswith("Error:")):
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_json_dumps(list(result)))
+        return result
+
+    async def _dispatch_api_call_async(self, prompt: str, system_prompt: str = "",
+                                       model: Optional[str] = None) -> tuple:
+        """Async counterpart of _dispatch_api_call"""
+        if not self._cache_enabled():
+            return await self._make_api_call_async(prompt, system_prompt, model)
+
+        cache_path = self._cache_path(prompt, system_prompt, model or self._default_model)
+        if cache_path.exists():
+            return tuple(_json_loads(cache_path.read_bytes()))
+
+        result = await self._make_api_call_async(prompt, system_prompt, model)
+        if not (isinstance(result[0], str) and result[0].startswith("Error:")):
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_json_dumps(list(result)))
+        return result
+
+    async def prewarm_async(self) -> None:
+        """
+        Open this provider's HTTPS connection ahead of the first real call.
+
+        Subclasses issue a cheap request (e.g. a model listing) so the
+        DNS+TCP+TLS setup happens during a concurrent pre-warm phase instead
+        of on the first trial's critical path. The default is a no-op.
+        """
+
     @abstractmethod
     def get_model_name(self) -> str:
         """Get the default model name for this provider"""
@@ -49,18 +182,43 @@ class BaseLLMClient(ABC):
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get model configuration and pricing info"""
-        return MODELS_INFO[self.provider_name]
-    
+        return self._model_info
+
     def calculate_cost(self, usage: TokenUsage) -> float:
         """Standardized cost calculation across all providers"""
-        model_info = self.get_model_info()
         uncached_input = max(usage.input_tokens - usage.cached_input_tokens, 0)
-        
-        input_cost = uncached_input * model_info['input_cost_per_million'] / 1_000_000
-        cached_cost = usage.cached_input_tokens * model_info['cached_input_cost_per_million'] / 1_000_000
-        output_cost = usage.output_tokens * model_info['output_cost_per_million'] / 1_000_000
-        
-        return round(input_cost + cached_cost + output_cost, 6)
+
+        return round(
+            uncached_input * self._input_rate
+            + usage.cached_input_tokens * self._cached_rate
+            + usage.output_tokens * self._output_rate,
+            6
+        )
+
+    def calculate_costs_vec(self, input_tokens: np.ndarray, cached_input_tokens: np.ndarray,
+                            output_tokens: np.ndarray) -> np.ndarray:
+        """
+        Vectorized cost calculation over whole arrays of token counts.
+
+        Same formula as calculate_cost, applied to all rows in one NumPy
+        pass — useful when costing an entire trial set at once.
+
+        Args:
+            input_tokens: Total input tokens per call
+            cached_input_tokens: Cached input tokens per call
+            output_tokens: Output tokens per call
+
+        Returns:
+            Array of per-call costs in USD, rounded to 6 decimal places
+        """
+        uncached_input = np.maximum(input_tokens - cached_input_tokens, 0)
+
+        return np.round(
+            uncached_input * self._input_rate
+            + cached_input_tokens * self._cached_rate
+            + output_tokens * self._output_rate,
+            6
+        )
     
     def process(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> LLMResponse:
         """
@@ -75,8 +233,8 @@ class BaseLLMClient(ABC):
             LLMResponse with output, usage, and cost information
         """
         try:
-            output, input_tokens, cached_input_tokens, output_tokens = self._make_api_call(
-                prompt, system_prompt, model
+            output, input_tokens, cached_input_tokens, output_tokens = self._normalize_result(
+                self._dispatch_api_call(prompt, system_prompt, model)
             )
             
             # Handle error responses
@@ -103,6 +261,112 @@ class BaseLLMClient(ABC):
                 model=model or self.get_model_name()
             )
             
+        except Exception as e:
+            return LLMResponse(
+                output=f"Error: {str(e)}",
+                usage=TokenUsage(0, 0, 0),
+                cost=0.0,
+                model=model or self.get_model_name()
+            )
+
+    def process_batch(self, prompts: list, system_prompt: str = "", model: Optional[str] = None) -> list:
+        """
+        Process several prompts with a single API call.
+
+        Marshals the prompts into one numbered request and splits the
+        completion back into per-prompt outputs. This amortizes the network
+        round trip (and prompt prefill) across the whole batch, at the cost
+        of approximate accounting: the call's token usage and cost are
+        divided evenly across the prompts.
+
+        Args:
+            prompts: List of user prompts
+            system_prompt: Optional system instructions
+            model: Optional model override
+
+        Returns:
+            List of LLMResponse, one per prompt
+        """
+        if not prompts:
+            return []
+
+        batch_prompt = "\n".join(
+            ["Respond to each of the following numbered queries. "
+             "Prefix each answer with 'ANSWER <number>:' on its own line."]
+            + [f"{i}. {p}" for i, p in enumerate(prompts, 1)]
+        )
+
+        response = self.process(batch_prompt, system_prompt, model)
+        k = len(prompts)
+
+        # Error responses apply to the whole batch
+        if response.output.startswith("Error:"):
+            return [response] * k
+
+        # Split the combined completion back into per-prompt answers
+        parts = re.split(r"ANSWER\s+(\d+):", response.output)
+        answers = {}
+        for number, text in zip(parts[1::2], parts[2::2]):
+            answers[int(number)] = text.strip()
+
+        per_prompt_usage = TokenUsage(
+            input_tokens=response.usage.input_tokens // k,
+            cached_input_tokens=response.usage.cached_input_tokens // k,
+            output_tokens=response.usage.output_tokens // k
+        )
+        per_prompt_cost = round(response.cost / k, 6)
+
+        return [
+            LLMResponse(
+                output=answers.get(i, ""),
+                usage=per_prompt_usage,
+                cost=per_prompt_cost,
+                model=response.model
+            )
+            for i in range(1, k + 1)
+        ]
+
+    async def process_async(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> LLMResponse:
+        """
+        Async counterpart of process() for concurrent multi-vendor fan-out.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system instructions
+            model: Optional model override
+
+        Returns:
+            LLMResponse with output, usage, and cost information
+        """
+        try:
+            output, input_tokens, cached_input_tokens, output_tokens = self._normalize_result(
+                await self._dispatch_api_call_async(prompt, system_prompt, model)
+            )
+
+            # Handle error responses
+            if isinstance(output, str) and output.startswith("Error:"):
+                return LLMResponse(
+                    output=output,
+                    usage=TokenUsage(0, 0, 0),
+                    cost=0.0,
+                    model=model or self.get_model_name()
+                )
+
+            usage = TokenUsage(
+                input_tokens=input_tokens or 0,
+                cached_input_tokens=cached_input_tokens or 0,
+                output_tokens=output_tokens or 0
+            )
+
+            cost = self.calculate_cost(usage)
+
+            return LLMResponse(
+                output=output,
+                usage=usage,
+                cost=cost,
+                model=model or self.get_model_name()
+            )
+
         except Exception as e:
             return LLMResponse(
                 output=f"Error: {str(e)}",
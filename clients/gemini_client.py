@@ -3,64 +3,203 @@ Enhanced Gemini client using base client architecture.
 Includes backward compatibility functions.
 """
 
-from google import genai
-from google.genai import types
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from functools import lru_cache
+
 from typing import Optional
 from .base_client import BaseLLMClient
-from config import GEMINI_API_KEY, MODELS_INFO
+from config import GEMINI_API_KEYS, MODELS
+
+# The google-genai SDK (and its protobuf/grpc baggage) is imported lazily
+# on first client construction so runs that never touch this vendor don't
+# pay its import cost; the module-level bindings stay patchable for tests
+genai = None
+genai_errors = None
+types = None
+
+
+def _import_sdk():
+    """Bind the google-genai SDK modules into module globals on first use"""
+    global genai, genai_errors, types
+    if genai is None:
+        from google import genai as _genai
+        from google.genai import errors as _errors
+        from google.genai import types as _types
+        genai = _genai
+        genai_errors = _errors
+        types = _types
+
+# Retry budget for rate-limit (429) and server (5xx) errors
+_MAX_ATTEMPTS = 3
 
 
 class GeminiClient(BaseLLMClient):
     """Enhanced Gemini client with standardized interface"""
-    
+
     def __init__(self):
         super().__init__("gemini")
-        self.client = genai.Client(api_key=GEMINI_API_KEY)
-    
-    def _make_api_call(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
-        """Make API call to Gemini"""
-        if model is None:
-            model = MODELS_INFO["gemini"]["model"]
-        
+        _import_sdk()
+        # One client per configured key; rotating to the next key on
+        # 429/5xx lets the same process sustain N x the per-key rate limit
+        self._clients = deque(genai.Client(api_key=key) for key in GEMINI_API_KEYS)
+
+    @property
+    def client(self) -> genai.Client:
+        """The client for the key currently at the front of the rotation"""
+        return self._clients[0]
+
+    def _should_retry(self, error: genai_errors.APIError, attempt: int) -> bool:
+        """
+        Decide whether an API error is worth another attempt.
+
+        Retryable failures (rate limit or server error) also rotate to the
+        next configured key, which may still have headroom when the current
+        one is exhausted.
+        """
+        code = getattr(error, 'code', None)
+        retryable = code == 429 or (isinstance(code, int) and code >= 500)
+        if not retryable or attempt >= _MAX_ATTEMPTS - 1:
+            return False
+        self._clients.rotate(-1)
+        return True
+
+    # Generation configs are immutable per system prompt, so build them once
+    # and reuse them; trials resend the same system prompt, so the cache
+    # almost always hits after the first call. Built lazily because the SDK
+    # is only imported on first client construction.
+    _CONFIG_NO_SYS = None
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _config_with_sys(system_prompt: str) -> types.GenerateContentConfig:
+        """Memoized config for a given system prompt"""
+        return types.GenerateContentConfig(system_instruction=system_prompt)
+
+    @classmethod
+    def _build_config(cls, system_prompt: str = "") -> types.GenerateContentConfig:
+        """Build (or reuse) the generation config"""
         if system_prompt:
-            config = types.GenerateContentConfig(
-                system_instruction=system_prompt
-            )
-        else:
-            config = types.GenerateContentConfig()
-            
-        response = self.client.models.generate_content(
-            model=model,
-            config=config,
-            contents=prompt
-        )
-        
-        output = getattr(response, 'text', str(response))
-        usage = getattr(response, 'usage_metadata', None)
-        input_tokens = usage.prompt_token_count if usage and hasattr(usage, 'prompt_token_count') else None
-        output_tokens = usage.candidates_token_count if usage and hasattr(usage, 'candidates_token_count') else None
-        
-
-        
-        # Check for cached token information
-        cached_input_tokens = 0
-        if usage and hasattr(usage, 'cached_content_token_count'):
+            return cls._config_with_sys(system_prompt)
+        if cls._CONFIG_NO_SYS is None:
+            cls._CONFIG_NO_SYS = types.GenerateContentConfig()
+        return cls._CONFIG_NO_SYS
+
+    @staticmethod
+    def _collect_stream(stream) -> tuple:
+        """
+        Drain a streamed generation into (output, usage_metadata).
+
+        Text chunks are accumulated as they arrive, so transfer overlaps
+        server-side generation; the final chunk carries the complete
+        usage metadata.
+        """
+        parts = []
+        usage = None
+        for chunk in stream:
+            text = getattr(chunk, 'text', None)
+            if text:
+                parts.append(text)
+            chunk_usage = getattr(chunk, 'usage_metadata', None)
+            if chunk_usage is not None:
+                usage = chunk_usage
+        return "".join(parts), usage
+
+    @staticmethod
+    def _extract_usage(output, usage) -> tuple:
+        """Normalize output text and usage metadata into the response tuple"""
+        if usage is None:
+            return output, None, 0, None, 0
+
+        # Plain attribute loads with one AttributeError fallback: the fields
+        # always exist on current SDK usage models, so the happy path skips
+        # the default-probing getattr machinery entirely. The SDK reports
+        # reasoning tokens as thoughts_token_count; the other field-name
+        # guesses probed here previously were dead code.
+        try:
+            input_tokens = usage.prompt_token_count
+            output_tokens = usage.candidates_token_count
             cached_input_tokens = usage.cached_content_token_count or 0
-        
-        # Look for reasoning tokens (found in thoughts_token_count!)
-        reasoning_tokens = 0
-        if usage:
-            # Check various possible field names for reasoning tokens
-            reasoning_tokens = (getattr(usage, 'thoughts_token_count', 0) or
-                              getattr(usage, 'reasoning_tokens', 0) or 
-                              getattr(usage, 'thinking_tokens', 0) or
-                              getattr(usage, 'reasoning_token_count', 0) or 0)
-        
+            reasoning_tokens = usage.thoughts_token_count or 0
+        except AttributeError:
+            input_tokens = getattr(usage, 'prompt_token_count', None)
+            output_tokens = getattr(usage, 'candidates_token_count', None)
+            cached_input_tokens = getattr(usage, 'cached_content_token_count', 0) or 0
+            reasoning_tokens = getattr(usage, 'thoughts_token_count', 0) or 0
+
         return output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens
+
+    async def prewarm_async(self) -> None:
+        """Open the HTTPS connection with a cheap model-listing request"""
+        await self.client.aio.models.list(config={'page_size': 1})
+
+    def _make_api_call(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
+        """Make API call to Gemini"""
+        if model is None:
+            model = self._default_model
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                stream = self.client.models.generate_content_stream(
+                    model=model,
+                    config=self._build_config(system_prompt),
+                    contents=prompt
+                )
+                return self._extract_usage(*self._collect_stream(stream))
+            except genai_errors.APIError as e:
+                if not self._should_retry(e, attempt):
+                    raise
+                time.sleep(2 ** attempt)
+
+    async def _make_api_call_async(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
+        """Make API call to Gemini using the SDK's async surface"""
+        if model is None:
+            model = self._default_model
+
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=model,
+                    config=self._build_config(system_prompt),
+                    contents=prompt
+                )
+
+                parts = []
+                usage = None
+                async for chunk in stream:
+                    text = getattr(chunk, 'text', None)
+                    if text:
+                        parts.append(text)
+                    chunk_usage = getattr(chunk, 'usage_metadata', None)
+                    if chunk_usage is not None:
+                        usage = chunk_usage
+
+                return self._extract_usage("".join(parts), usage)
+            except genai_errors.APIError as e:
+                if not self._should_retry(e, attempt):
+                    raise
+                await asyncio.sleep(2 ** attempt)
     
     def get_model_name(self) -> str:
         """Get the default model name for Gemini"""
-        return MODELS_INFO["gemini"]["model"]
+        return self._default_model
+
+
+# Module-level client reused across calls so the underlying HTTP connection
+# pool (and its TLS session) survives between trials instead of being rebuilt
+# on every request
+_client_instance = None
+
+
+def _get_client() -> GeminiClient:
+    """Lazily create and reuse a single GeminiClient instance"""
+    global _client_instance
+    if _client_instance is None:
+        _client_instance = GeminiClient()
+    return _client_instance
 
 
 # Backward compatibility functions
@@ -77,13 +216,32 @@ def process_with_gemini(prompt, system_prompt, model=None):
         tuple: (output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens)
     """
     try:
-        client = GeminiClient()
-        output, input_tokens, cached_tokens, output_tokens, reasoning_tokens = client._make_api_call(prompt, system_prompt, model)
+        client = _get_client()
+        output, input_tokens, cached_tokens, output_tokens, reasoning_tokens = client._dispatch_api_call(prompt, system_prompt, model)
         return output, input_tokens, cached_tokens, output_tokens, reasoning_tokens
     except Exception as e:
         return f"Gemini error: {str(e)}", None, 0, None, 0
 
 
+async def process_with_gemini_async(prompt, system_prompt, model=None):
+    """
+    Async counterpart of process_with_gemini for concurrent vendor fan-out.
+
+    Returns:
+        tuple: (output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens)
+    """
+    try:
+        client = _get_client()
+        return await client._dispatch_api_call_async(prompt, system_prompt, model)
+    except Exception as e:
+        return f"Gemini error: {str(e)}", None, 0, None, 0
+
+
+# Bound once at import: the configured model name is a constant, so the
+# per-trial wrapper calls skip the MODELS dict lookup
+_MODEL_NAME = MODELS["gemini"]
+
+
 def get_model_name():
-    """Backward compatibility wrapper"""
-    return GeminiClient().get_model_name()
\ No newline at end of file
+    """Backward compatibility wrapper; returns the configured model name"""
+    return _MODEL_NAME
\ No newline at end of file
@@ -3,60 +3,205 @@ Enhanced Grok client using base client architecture.
 Includes backward compatibility functions.
 """
 
-from openai import OpenAI
+import hashlib
+import operator
+
 from typing import Optional
+from ._chat import build_messages
+from ._http import get_shared_async_client
+from ._retry import retry_transient
 from .base_client import BaseLLMClient
-from config import GROK_API_KEY, MODELS_INFO, GROK_BASE_URL
+from config import GROK_API_KEY, MODELS, GROK_BASE_URL
+
+# The openai SDK is imported lazily on first client construction so runs
+# that never touch this vendor don't pay its import cost; the module-level
+# bindings stay patchable for tests
+OpenAI = None
+AsyncOpenAI = None
+
+
+def _import_sdk():
+    """Bind the openai SDK classes into module globals on first use"""
+    global OpenAI, AsyncOpenAI
+    if OpenAI is None or AsyncOpenAI is None:
+        import openai
+        if OpenAI is None:
+            OpenAI = openai.OpenAI
+        if AsyncOpenAI is None:
+            AsyncOpenAI = openai.AsyncOpenAI
+
+# Precompiled usage accessors: one C-level attribute walk instead of
+# per-field getattr probes on every response; the nested detail walks
+# raise AttributeError when the details object is absent or None
+_usage_tokens = operator.attrgetter('prompt_tokens', 'completion_tokens')
+_cached_tokens = operator.attrgetter('prompt_tokens_details.cached_tokens')
+_reasoning_tokens = operator.attrgetter('completion_tokens_details.reasoning_tokens')
 
 
 class GrokClient(BaseLLMClient):
     """Enhanced Grok client with standardized interface"""
-    
+
     def __init__(self):
         super().__init__("grok")
+        _import_sdk()
         self.client = OpenAI(
             api_key=GROK_API_KEY,
             base_url=GROK_BASE_URL,
         )
-    
+        self._async_client = None
+        self._async_http_client = None
+
+    # Memoized payload builder shared with the other OpenAI-protocol clients
+    _build_messages = staticmethod(build_messages)
+
+    @staticmethod
+    def _cache_key(system_prompt: str, model: str) -> str:
+        """
+        Stable prompt-cache key for this (system prompt, model) pair.
+
+        Trials re-send an identical prefix, so routing them to the same
+        cache entry lets the provider bill the prefix at the cached rate.
+        """
+        digest = hashlib.sha1(f"{system_prompt}:{model}".encode('utf-8')).hexdigest()
+        return f"token-counter:{digest}"
+
+    @staticmethod
+    def _collect_stream(stream) -> tuple:
+        """
+        Drain a streamed completion into (output, usage).
+
+        Content deltas are accumulated as they arrive, so transfer overlaps
+        server-side generation; with include_usage the terminal chunk
+        carries the token counts.
+        """
+        parts = []
+        usage = None
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+            if chunk.usage is not None:
+                usage = chunk.usage
+        return "".join(parts), usage
+
+    @staticmethod
+    def _extract_usage(output, usage) -> tuple:
+        """Normalize output text and a usage object into the response tuple"""
+        try:
+            input_tokens, output_tokens = _usage_tokens(usage)
+        except AttributeError:
+            input_tokens = output_tokens = None
+
+        # Cached tokens from prompt_tokens_details
+        try:
+            cached_tokens = _cached_tokens(usage) or 0
+        except AttributeError:
+            cached_tokens = 0
+
+        # Reasoning tokens from completion_tokens_details
+        try:
+            reasoning_tokens = _reasoning_tokens(usage) or 0
+        except AttributeError:
+            reasoning_tokens = 0
+
+        return output, input_tokens, cached_tokens, output_tokens, reasoning_tokens
+
+    def _get_async_client(self):
+        """
+        Lazily create and reuse the native async client.
+
+        Rebuilt whenever the shared HTTP pool it was constructed with has
+        been closed and replaced, so a second run in the same process
+        doesn't dispatch onto a closed transport.
+        """
+        http_client = get_shared_async_client()
+        if self._async_client is None or self._async_http_client is not http_client:
+            self._async_client = AsyncOpenAI(
+                api_key=GROK_API_KEY,
+                base_url=GROK_BASE_URL,
+                http_client=http_client,
+            )
+            self._async_http_client = http_client
+        return self._async_client
+
+    async def prewarm_async(self) -> None:
+        """Open the HTTPS connection with a cheap model-listing request"""
+        await self._get_async_client().models.list()
+
+    @retry_transient
     def _make_api_call(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
         """Make API call to Grok"""
         if model is None:
-            model = MODELS_INFO["grok"]["model"]
-        
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        completion = self.client.chat.completions.create(
+            model = self._default_model
+
+        stream = self.client.chat.completions.create(
             model=model,
-            messages=messages
+            messages=self._build_messages(prompt, system_prompt),
+            extra_body={"prompt_cache_key": self._cache_key(system_prompt, model)},
+            stream=True,
+            stream_options={"include_usage": True}
         )
-        
-        output = completion.choices[0].message.content
-        input_tokens = getattr(completion.usage, 'prompt_tokens', None)
-        output_tokens = getattr(completion.usage, 'completion_tokens', None)
-        
-        # Get cached tokens from prompt_tokens_details
-        cached_tokens = 0
-        if (hasattr(completion, 'usage') and completion.usage and 
-            hasattr(completion.usage, 'prompt_tokens_details') and 
-            completion.usage.prompt_tokens_details):
-            cached_tokens = getattr(completion.usage.prompt_tokens_details, 'cached_tokens', 0) or 0
-        
-        # BREAKTHROUGH: Get reasoning tokens from completion_tokens_details!
-        reasoning_tokens = 0
-        if (hasattr(completion, 'usage') and completion.usage and 
-            hasattr(completion.usage, 'completion_tokens_details') and 
-            completion.usage.completion_tokens_details):
-            reasoning_tokens = getattr(completion.usage.completion_tokens_details, 'reasoning_tokens', 0) or 0
-        
-        return output, input_tokens, cached_tokens, output_tokens, reasoning_tokens
-    
+
+        return self._extract_usage(*self._collect_stream(stream))
+
+    @retry_transient
+    async def _make_api_call_async(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
+        """Make API call to Grok using the native async client"""
+        if model is None:
+            model = self._default_model
+
+        stream = await self._get_async_client().chat.completions.create(
+            model=model,
+            messages=self._build_messages(prompt, system_prompt),
+            extra_body={"prompt_cache_key": self._cache_key(system_prompt, model)},
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+
+        parts = []
+        usage = None
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+            if chunk.usage is not None:
+                usage = chunk.usage
+
+        return self._extract_usage("".join(parts), usage)
+
     def get_model_name(self) -> str:
         """Get the default model name for Grok"""
-        return MODELS_INFO["grok"]["model"]
+        return self._default_model
+
+
+def extract_cached_tokens(completion) -> int:
+    """
+    Cached prompt tokens from a chat completion, 0 when absent.
+
+    Uses the same precompiled accessor as the client's own usage
+    extraction, so tests and external accounting code exercise the exact
+    production logic without a live response.
+    """
+    try:
+        return _cached_tokens(completion.usage) or 0
+    except AttributeError:
+        return 0
+
+
+# Module-level client reused across calls so the underlying HTTP connection
+# pool (and its TLS session) survives between trials instead of being rebuilt
+# on every request
+_client_instance = None
+
+
+def _get_client() -> GrokClient:
+    """Lazily create and reuse a single GrokClient instance"""
+    global _client_instance
+    if _client_instance is None:
+        _client_instance = GrokClient()
+    return _client_instance
 
 
 # Backward compatibility functions
@@ -73,13 +218,32 @@ def process_with_grok(prompt, system_prompt, model=None):
         tuple: (output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens)
     """
     try:
-        client = GrokClient()
-        output, input_tokens, cached_tokens, output_tokens, reasoning_tokens = client._make_api_call(prompt, system_prompt, model)
+        client = _get_client()
+        output, input_tokens, cached_tokens, output_tokens, reasoning_tokens = client._dispatch_api_call(prompt, system_prompt, model)
         return output, input_tokens, cached_tokens, output_tokens, reasoning_tokens
     except Exception as e:
         return f"Grok error: {str(e)}", None, 0, None, 0
 
 
+async def process_with_grok_async(prompt, system_prompt, model=None):
+    """
+    Async counterpart of process_with_grok for concurrent vendor fan-out.
+
+    Returns:
+        tuple: (output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens)
+    """
+    try:
+        client = _get_client()
+        return await client._dispatch_api_call_async(prompt, system_prompt, model)
+    except Exception as e:
+        return f"Grok error: {str(e)}", None, 0, None, 0
+
+
+# Bound once at import: the configured model name is a constant, so the
+# per-trial wrapper calls skip the MODELS dict lookup
+_MODEL_NAME = MODELS["grok"]
+
+
 def get_model_name():
-    """Backward compatibility wrapper"""
-    return GrokClient().get_model_name()
\ No newline at end of file
+    """Backward compatibility wrapper; returns the configured model name"""
+    return _MODEL_NAME
\ No newline at end of file
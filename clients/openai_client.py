@@ -3,61 +3,187 @@ Enhanced OpenAI client using base client architecture.
 Includes backward compatibility functions.
 """
 
-from openai import OpenAI
+import hashlib
+import operator
+
 from typing import Optional
+from ._chat import build_messages
+from ._http import get_shared_async_client
+from ._retry import retry_transient
 from .base_client import BaseLLMClient
-from config import OPENAI_API_KEY, MODELS_INFO
+from config import OPENAI_API_KEY, MODELS
+
+# The openai SDK is imported lazily on first client construction so runs
+# that never touch this vendor don't pay its import cost; the module-level
+# bindings stay patchable for tests
+OpenAI = None
+AsyncOpenAI = None
+
+
+def _import_sdk():
+    """Bind the openai SDK classes into module globals on first use"""
+    global OpenAI, AsyncOpenAI
+    if OpenAI is None or AsyncOpenAI is None:
+        import openai
+        if OpenAI is None:
+            OpenAI = openai.OpenAI
+        if AsyncOpenAI is None:
+            AsyncOpenAI = openai.AsyncOpenAI
+
+# Precompiled usage accessors: one C-level attribute walk instead of
+# per-field getattr probes on every response; the nested detail walks
+# raise AttributeError when the details object is absent or None
+_usage_tokens = operator.attrgetter('prompt_tokens', 'completion_tokens')
+_cached_tokens = operator.attrgetter('prompt_tokens_details.cached_tokens')
+_reasoning_tokens = operator.attrgetter('completion_tokens_details.reasoning_tokens')
 
 
 class OpenAIClient(BaseLLMClient):
     """Enhanced OpenAI client with standardized interface"""
-    
+
     def __init__(self):
         super().__init__("openai")
+        _import_sdk()
         self.client = OpenAI(api_key=OPENAI_API_KEY)
-    
+        self._async_client = None
+        self._async_http_client = None
+
+    # Memoized payload builder shared with the other OpenAI-protocol clients
+    _build_messages = staticmethod(build_messages)
+
+    @staticmethod
+    def _cache_key(system_prompt: str, model: str) -> str:
+        """
+        Stable prompt-cache key for this (system prompt, model) pair.
+
+        Trials re-send an identical prefix, so routing them to the same
+        cache entry lets the provider bill the prefix at the cached rate.
+        """
+        digest = hashlib.sha1(f"{system_prompt}:{model}".encode('utf-8')).hexdigest()
+        return f"token-counter:{digest}"
+
+    @staticmethod
+    def _collect_stream(stream) -> tuple:
+        """
+        Drain a streamed completion into (output, usage).
+
+        Content deltas are accumulated as they arrive, so transfer overlaps
+        server-side generation; with include_usage the terminal chunk
+        carries the token counts.
+        """
+        parts = []
+        usage = None
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+            if chunk.usage is not None:
+                usage = chunk.usage
+        return "".join(parts), usage
+
+    @staticmethod
+    def _extract_usage(output, usage) -> tuple:
+        """Normalize output text and a usage object into the response tuple"""
+        try:
+            input_tokens, output_tokens = _usage_tokens(usage)
+        except AttributeError:
+            input_tokens = output_tokens = None
+
+        # Cached input tokens if available
+        try:
+            cached_input_tokens = _cached_tokens(usage) or 0
+        except AttributeError:
+            cached_input_tokens = 0
+
+        # Reasoning tokens if available (for o3 models)
+        try:
+            reasoning_tokens = _reasoning_tokens(usage) or 0
+        except AttributeError:
+            reasoning_tokens = 0
+
+        return output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens
+
+    def _get_async_client(self):
+        """
+        Lazily create and reuse the native async client.
+
+        Rebuilt whenever the shared HTTP pool it was constructed with has
+        been closed and replaced, so a second run in the same process
+        doesn't dispatch onto a closed transport.
+        """
+        http_client = get_shared_async_client()
+        if self._async_client is None or self._async_http_client is not http_client:
+            self._async_client = AsyncOpenAI(
+                api_key=OPENAI_API_KEY,
+                http_client=http_client,
+            )
+            self._async_http_client = http_client
+        return self._async_client
+
+    async def prewarm_async(self) -> None:
+        """Open the HTTPS connection with a cheap model-listing request"""
+        await self._get_async_client().models.list()
+
+    @retry_transient
     def _make_api_call(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
         """Make API call to OpenAI"""
         if model is None:
-            model = MODELS_INFO["openai"]["model"]
-        
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        response = self.client.chat.completions.create(
+            model = self._default_model
+
+        stream = self.client.chat.completions.create(
             model=model,
-            messages=messages
+            messages=self._build_messages(prompt, system_prompt),
+            extra_body={"prompt_cache_key": self._cache_key(system_prompt, model)},
+            stream=True,
+            stream_options={"include_usage": True}
         )
-        
-        output = response.choices[0].message.content
-        input_tokens = getattr(response.usage, 'prompt_tokens', None)
-        output_tokens = getattr(response.usage, 'completion_tokens', None)
-        
-        # Get cached input tokens if available
-        cached_input_tokens = 0
-        prompt_tokens_details = getattr(response.usage, 'prompt_tokens_details', None)
-        if prompt_tokens_details:
-            if isinstance(prompt_tokens_details, dict):
-                cached_input_tokens = prompt_tokens_details.get('cached_tokens', 0) or 0
-            else:
-                cached_input_tokens = getattr(prompt_tokens_details, 'cached_tokens', 0) or 0
-        
-        # Get reasoning tokens if available (for o3 models)
-        reasoning_tokens = 0
-        completion_tokens_details = getattr(response.usage, 'completion_tokens_details', None)
-        if completion_tokens_details:
-            if isinstance(completion_tokens_details, dict):
-                reasoning_tokens = completion_tokens_details.get('reasoning_tokens', 0) or 0
-            else:
-                reasoning_tokens = getattr(completion_tokens_details, 'reasoning_tokens', 0) or 0
-        
-        return output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens
-    
+
+        return self._extract_usage(*self._collect_stream(stream))
+
+    @retry_transient
+    async def _make_api_call_async(self, prompt: str, system_prompt: str = "", model: Optional[str] = None) -> tuple:
+        """Make API call to OpenAI using the native async client"""
+        if model is None:
+            model = self._default_model
+
+        stream = await self._get_async_client().chat.completions.create(
+            model=model,
+            messages=self._build_messages(prompt, system_prompt),
+            extra_body={"prompt_cache_key": self._cache_key(system_prompt, model)},
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+
+        parts = []
+        usage = None
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+            if chunk.usage is not None:
+                usage = chunk.usage
+
+        return self._extract_usage("".join(parts), usage)
+
     def get_model_name(self) -> str:
         """Get the default model name for OpenAI"""
-        return MODELS_INFO["openai"]["model"]
+        return self._default_model
+
+
+# Module-level client reused across calls so the underlying HTTP connection
+# pool (and its TLS session) survives between trials instead of being rebuilt
+# on every request
+_client_instance = None
+
+
+def _get_client() -> OpenAIClient:
+    """Lazily create and reuse a single OpenAIClient instance"""
+    global _client_instance
+    if _client_instance is None:
+        _client_instance = OpenAIClient()
+    return _client_instance
 
 
 # Backward compatibility functions
@@ -73,11 +199,33 @@ def process_with_openai(prompt, system_prompt, model=None):
     Returns:
         tuple: (output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens)
     """
-    client = OpenAIClient()
-    output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens = client._make_api_call(prompt, system_prompt, model)
-    return output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens
+    try:
+        client = _get_client()
+        output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens = client._dispatch_api_call(prompt, system_prompt, model)
+        return output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens
+    except Exception as e:
+        return f"OpenAI error: {str(e)}", None, 0, None, 0
+
+
+async def process_with_openai_async(prompt, system_prompt, model=None):
+    """
+    Async counterpart of process_with_openai for concurrent vendor fan-out.
+
+    Returns:
+        tuple: (output, input_tokens, cached_input_tokens, output_tokens, reasoning_tokens)
+    """
+    try:
+        client = _get_client()
+        return await client._dispatch_api_call_async(prompt, system_prompt, model)
+    except Exception as e:
+        return f"OpenAI error: {str(e)}", None, 0, None, 0
+
+
+# Bound once at import: the configured model name is a constant, so the
+# per-trial wrapper calls skip the MODELS dict lookup
+_MODEL_NAME = MODELS["openai"]
 
 
 def get_model_name():
-    """Backward compatibility wrapper"""
-    return OpenAIClient().get_model_name()
\ No newline at end of file
+    """Backward compatibility wrapper; returns the configured model name"""
+    return _MODEL_NAME
\ No newline at end of file
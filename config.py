@@ -3,37 +3,109 @@ Configuration file for the Token Counter project.
 Contains API keys, default settings, and model configurations.
 """
 
+import logging
 import os
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
-try:
-    from zoneinfo import ZoneInfo  # Python 3.9+
-except ImportError:
-    from pytz import timezone as ZoneInfo  # Fallback for older Python
-
-# Load environment variables from .env file if it exists
-try:
-    from dotenv import load_dotenv
-    
-    # Look for .env file in the project root
-    env_path = Path(__file__).parent / '.env'
-    if env_path.exists():
-        # Use override=True to ensure .env file takes priority over OS environment variables
-        load_dotenv(env_path, override=True)
-        print(f"Loaded environment variables from {env_path} (overriding system variables)")
-    else:
-        print("No .env file found, using system environment variables")
-        
-except ImportError:
-    print("python-dotenv not installed. Install with: pip install python-dotenv")
-    print("Using system environment variables only")
-
-# API Keys - Load from .env file first, then system environment, then fallback
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "your-openai-api-key")
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "your-anthropic-api-key")
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "your-gemini-api-key")
-GROK_API_KEY = os.getenv("GROK_API_KEY", "your-grok-api-key")
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _zoneinfo_cls():
+    """Resolve the timezone factory on first use.
+
+    stdlib zoneinfo on Python 3.9+, pytz only as a fallback — and neither
+    is imported until a timezone is actually needed.
+    """
+    try:
+        from zoneinfo import ZoneInfo  # Python 3.9+
+        return ZoneInfo
+    except ImportError:
+        from pytz import timezone  # Fallback for older Python
+        return timezone
+
+
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load environment variables from a .env file if one exists.
+
+    Memoized so repeated imports/reloads of this module don't re-stat the
+    filesystem or re-parse the file.
+    """
+    try:
+        from dotenv import load_dotenv
+
+        # Look for .env file in the project root
+        env_path = Path(__file__).parent / '.env'
+        if env_path.exists():
+            # Use override=True to ensure .env file takes priority over OS environment variables
+            load_dotenv(env_path, override=True)
+            logger.debug("Loaded environment variables from %s (overriding system variables)", env_path)
+        else:
+            logger.debug("No .env file found, using system environment variables")
+
+    except ImportError:
+        logger.debug("python-dotenv not installed. Install with: pip install python-dotenv")
+        logger.debug("Using system environment variables only")
+
+
+@dataclass(frozen=True)
+class _Env:
+    """Snapshot of every environment-derived setting, read once per process"""
+    openai_api_key: str
+    anthropic_api_key: str
+    gemini_api_key: str
+    grok_api_key: str
+    gemini_api_keys: tuple
+    timezone: str
+
+
+@lru_cache(maxsize=1)
+def _env() -> _Env:
+    """Load .env and read all environment settings into one frozen record.
+
+    Memoized so every consumer — including repeated module reloads and the
+    PEP 562 attribute exports below — shares a single read of the
+    environment instead of re-probing os.environ per lookup.
+    """
+    _load_env()
+    gemini_api_key = os.getenv("GEMINI_API_KEY", "your-gemini-api-key")
+    # Optional numbered Gemini keys (GEMINI_API_KEY_1..9) rotated under
+    # rate-limit pressure; falls back to the single key when none are set
+    numbered_keys = tuple(
+        k for k in (os.getenv(f"GEMINI_API_KEY_{i}") for i in range(1, 10)) if k
+    )
+    return _Env(
+        openai_api_key=os.getenv("OPENAI_API_KEY", "your-openai-api-key"),
+        anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", "your-anthropic-api-key"),
+        gemini_api_key=gemini_api_key,
+        grok_api_key=os.getenv("GROK_API_KEY", "your-grok-api-key"),
+        gemini_api_keys=numbered_keys or (gemini_api_key,),
+        timezone=os.getenv("TOKEN_COUNTER_TIMEZONE", "America/Chicago"),
+    )
+
+
+# Environment-derived module attributes, exported lazily (PEP 562) from the
+# cached _Env record; `from config import OPENAI_API_KEY` works as before
+_ENV_EXPORTS = {
+    "OPENAI_API_KEY": "openai_api_key",
+    "ANTHROPIC_API_KEY": "anthropic_api_key",
+    "GEMINI_API_KEY": "gemini_api_key",
+    "GROK_API_KEY": "grok_api_key",
+    "GEMINI_API_KEYS": "gemini_api_keys",
+    "TIMEZONE": "timezone",
+}
+
+
+def __getattr__(name):
+    field = _ENV_EXPORTS.get(name)
+    if field is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(_env(), field)
 
 # Default prompts and settings
 DEFAULT_USER_PROMPT = "Give me the word 'halt' without any formatting or additional text."
@@ -44,7 +116,8 @@ DEFAULT_NUM_TRIALS = 1
 # This is the single source of truth for both model names and pricing
 # Pricing is manually maintained - update when providers change rates
 # Last updated: January 2025
-MODELS_INFO = {
+# Wrapped in MappingProxyType so the pricing table is read-only at runtime
+MODELS_INFO = MappingProxyType({
     "openai": {
         "model": "o3",  # o3-mini model with reasoning tokens
         "input_cost_per_million": 1.25,    # USD per 1M input tokens (o3-mini pricing)
@@ -118,32 +191,92 @@ MODELS_INFO = {
         # Note: Grok has tiered pricing - rates increase after 128K tokens
         # Higher context pricing applies when total context exceeds 128K tokens
     }
-}
+})
+
+# Backward-compat alias for consumers written against the dict name
+MODELS_INFO_DICT = MODELS_INFO
+
+# Read-only vendor -> default model name view, derived once at import so
+# callers that only need the model name do one flat lookup instead of two
+MODELS = MappingProxyType({name: info["model"] for name, info in MODELS_INFO.items()})
+
+
+@dataclass(frozen=True, slots=True)
+class VendorInfo:
+    """Flat, typed view of one vendor's default model and base pricing.
+
+    Attribute access on a slotted dataclass replaces two chained dict
+    lookups per read on the hot path; frozen so the pricing table cannot
+    drift at runtime.
+    """
+    model: str
+    input_cost_per_million: float
+    cached_input_cost_per_million: float
+    output_cost_per_million: float
+
+
+def _vendor_info(info):
+    """Build the flat typed record from one MODELS_INFO entry"""
+    return VendorInfo(
+        model=info["model"],
+        input_cost_per_million=info["input_cost_per_million"],
+        cached_input_cost_per_million=info.get("cached_input_cost_per_million", 0.0),
+        output_cost_per_million=info["output_cost_per_million"],
+    )
 
-# Timezone configuration (default: Central Time)
-TIMEZONE = os.getenv("TOKEN_COUNTER_TIMEZONE", "America/Chicago")  # Change to your preferred IANA timezone string
+
+# Typed namespace derived once at import: VENDOR_INFO.openai.model etc.
+# MODELS_INFO above stays the source of truth (tiered/cache pricing details
+# live only there); this view covers the flat fields the clients read per call
+VENDOR_INFO = SimpleNamespace(
+    **{name: _vendor_info(info) for name, info in MODELS_INFO.items()}
+)
+
+# Timezone configuration lives in _Env (TOKEN_COUNTER_TIMEZONE, default
+# Central Time) and is exported lazily as TIMEZONE via __getattr__ above
 
 # Output settings
+# Separator resolved once at import so filename generation is pure string
+# concatenation instead of os.path.join's varargs handling per call
+_OUTPUT_PREFIX = "outputs" + os.sep
+
+
+@lru_cache(maxsize=4)
+def _get_tz(name):
+    """Resolve an IANA timezone name to a ZoneInfo, memoized.
+
+    ZoneInfo construction reads tzdata from disk; caching it means only the
+    first filename generation pays that cost.
+    """
+    try:
+        return _zoneinfo_cls()(name)
+    except Exception:
+        return None
+
+
 def get_timestamped_filename(base_name="api_results", extension="csv"):
     """Generate a timestamped filename for the current run in the outputs/ folder.
-    
+
     Uses 24-hour time and configured timezone, with timezone abbreviation in the filename.
     """
-    try:
-        tz = ZoneInfo(TIMEZONE)
-    except Exception:
-        tz = None
+    tz = _get_tz(_env().timezone)
     now = datetime.now(tz) if tz else datetime.now()
-    timestamp = now.strftime("%Y%m%d_%H%M%S") + f"{now.microsecond // 1000:03d}"
-    tz_abbr = now.strftime('%Z') if tz else "local"
-    return os.path.join("outputs", f"{base_name}_{timestamp}_{tz_abbr}.{extension}")
+    # One fused strftime call instead of separate timestamp and %Z passes
+    if tz:
+        timestamp, tz_abbr = now.strftime("%Y%m%d_%H%M%S|%Z").split("|", 1)
+    else:
+        timestamp, tz_abbr = now.strftime("%Y%m%d_%H%M%S"), "local"
+    millis = now.microsecond // 1000
+    return f"{_OUTPUT_PREFIX}{base_name}_{timestamp}{millis:03d}_{tz_abbr}.{extension}"
 
 CSV_OUTPUT_PATH = "api_results.csv"  # Default fallback, usually overridden with timestamp
-CSV_COLUMNS = [
-    'Run Number', 'Vendor', 'Model', 'User Prompt', 
+# Tuple rather than list: faster to iterate per row and immune to accidental mutation
+CSV_COLUMNS = (
+    'Run Number', 'Vendor', 'Model', 'User Prompt',
     'System Prompt', 'Output', 'Input Tokens', 'Cached Input Tokens', 'Output Tokens', 'Reasoning Tokens',
-    'Input Token Cost (USD)', 'Cached Token Cost (USD)', 'Output Token Cost (USD)', 'Reasoning Token Cost (USD)', 'Cost (USD)'
-]
+    'Input Token Cost (USD)', 'Cached Token Cost (USD)', 'Output Token Cost (USD)', 'Reasoning Token Cost (USD)', 'Cost (USD)',
+    'Error'
+)
 
 # Note: For providers with caching (OpenAI, Gemini, Anthropic, Grok):
 # - "Input Tokens" = TOTAL input tokens from API (I_total)
@@ -3,7 +3,8 @@ Configuration validation utilities.
 """
 
 import os
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -15,37 +16,48 @@ class APIConfig:
     base_url: Optional[str] = None
     
     def validate(self) -> bool:
-        """Validate that API key is properly set"""
-        return (
-            self.key and 
-            self.key != "your-openai-api-key" and
-            self.key != "your-anthropic-api-key" and
-            self.key != "your-gemini-api-key" and
-            self.key != "your-grok-api-key" and
-            not self.key.startswith("your-")
-        )
+        """Validate that API key is properly set.
+
+        The "your-" prefix test subsumes every placeholder sentinel
+        (your-openai-api-key etc.), so one check covers them all.
+        """
+        return bool(self.key) and not self.key.startswith("your-")
+
+
+@lru_cache(maxsize=8)
+def _validate_keys_cached(keys: Tuple[str, str, str, str]) -> Dict[str, bool]:
+    """Build and validate the provider configs for one set of key values.
+
+    Memoized on the key values themselves, so repeated validation within a
+    run is a dict return instead of rebuilding four APIConfig records — and
+    the cache invalidates naturally if the keys change.
+    """
+    openai_key, gemini_key, anthropic_key, grok_key = keys
+    from config import MODELS_INFO, GROK_BASE_URL
+
+    configs = {
+        'openai': APIConfig(openai_key, MODELS_INFO['openai']['model']),
+        'gemini': APIConfig(gemini_key, MODELS_INFO['gemini']['model']),
+        'anthropic': APIConfig(anthropic_key, MODELS_INFO['anthropic']['model']),
+        'grok': APIConfig(grok_key, MODELS_INFO['grok']['model'], GROK_BASE_URL)
+    }
+
+    return {name: config.validate() for name, config in configs.items()}
 
 
 def validate_api_keys() -> Dict[str, bool]:
     """
     Validate all API keys are properly set.
-    
+
     Returns:
         Dict mapping provider names to validation status
     """
-    from config import (
-        OPENAI_API_KEY, GEMINI_API_KEY, ANTHROPIC_API_KEY, GROK_API_KEY,
-        MODELS_INFO, GROK_BASE_URL
+    from config import _env
+
+    env = _env()
+    return _validate_keys_cached(
+        (env.openai_api_key, env.gemini_api_key, env.anthropic_api_key, env.grok_api_key)
     )
-    
-    configs = {
-        'openai': APIConfig(OPENAI_API_KEY, MODELS_INFO['openai']['model']),
-        'gemini': APIConfig(GEMINI_API_KEY, MODELS_INFO['gemini']['model']),
-        'anthropic': APIConfig(ANTHROPIC_API_KEY, MODELS_INFO['anthropic']['model']),
-        'grok': APIConfig(GROK_API_KEY, MODELS_INFO['grok']['model'], GROK_BASE_URL)
-    }
-    
-    return {name: config.validate() for name, config in configs.items()}
 
 
 def get_valid_providers():
@@ -54,16 +66,22 @@ def get_valid_providers():
     return [provider for provider, is_valid in validation_results.items() if is_valid]
 
 
+# Display labels padded once at import instead of capitalizing and
+# re-padding per report line
+_REPORT_LABELS = {p: f"{p.capitalize():12}" for p in ('openai', 'gemini', 'anthropic', 'grok')}
+
+
 def print_validation_report():
     """Print a validation report for all providers"""
     validation_results = validate_api_keys()
-    
+
     print("API Key Validation Report:")
     print("-" * 30)
-    
+
     for provider, is_valid in validation_results.items():
         status = "✅ Valid" if is_valid else "❌ Invalid/Missing"
-        print(f"{provider.capitalize():12} {status}")
+        label = _REPORT_LABELS.get(provider) or f"{provider.capitalize():12}"
+        print(f"{label} {status}")
     
     valid_count = sum(validation_results.values())
     total_count = len(validation_results)
@@ -10,6 +10,22 @@ from openai import OpenAI
 from config import GROK_API_KEY, MODELS_INFO, GROK_BASE_URL
 import json
 
+
+def _usage_to_dict(usage):
+    """Serialize a usage object to a plain dict in one pass.
+
+    model_dump() walks the Pydantic model once at C level, which is far
+    cheaper than probing every name from dir() through descriptor logic;
+    dir()+getattr stays only as a last-resort fallback.
+    """
+    if hasattr(usage, 'model_dump'):
+        return usage.model_dump()
+    if hasattr(usage, 'dict'):
+        return usage.dict()
+    return {attr: getattr(usage, attr, None)
+            for attr in dir(usage) if not attr.startswith('_')}
+
+
 def debug_grok_response():
     """Debug the Grok API response to see cache token structure."""
     try:
@@ -17,70 +33,51 @@ def debug_grok_response():
             api_key=GROK_API_KEY,
             base_url=GROK_BASE_URL,
         )
-        
+
         completion = client.chat.completions.create(
             model=MODELS_INFO["grok"]["model"],
             messages=[{"role": "user", "content": "Give me one sentence about what a penguin is."}]
         )
-        
+
+        usage_dict = _usage_to_dict(completion.usage)
+
         print("=== FULL GROK API RESPONSE ===")
         print(f"Model: {completion.model}")
         print(f"Usage object: {completion.usage}")
-        
-        if hasattr(completion.usage, 'prompt_tokens'):
-            print(f"prompt_tokens: {completion.usage.prompt_tokens}")
-        
-        if hasattr(completion.usage, 'completion_tokens'):
-            print(f"completion_tokens: {completion.usage.completion_tokens}")
-            
-        if hasattr(completion.usage, 'total_tokens'):
-            print(f"total_tokens: {completion.usage.total_tokens}")
-        
+
+        for field in ('prompt_tokens', 'completion_tokens', 'total_tokens'):
+            if field in usage_dict:
+                print(f"{field}: {usage_dict[field]}")
+
         print("\n=== CHECKING FOR PROMPT_TOKENS_DETAILS ===")
-        if hasattr(completion.usage, 'prompt_tokens_details'):
-            print(f"prompt_tokens_details exists: {completion.usage.prompt_tokens_details}")
-            details = completion.usage.prompt_tokens_details
-            
-            # Check all attributes of prompt_tokens_details
+        prompt_details = usage_dict.get('prompt_tokens_details')
+        if prompt_details is not None:
+            print(f"prompt_tokens_details exists: {prompt_details}")
             print("prompt_tokens_details attributes:")
-            for attr in dir(details):
-                if not attr.startswith('_'):
-                    value = getattr(details, attr, None)
-                    print(f"  {attr}: {value}")
+            for attr, value in prompt_details.items():
+                print(f"  {attr}: {value}")
         else:
             print("prompt_tokens_details NOT found")
-            
+
         print("\n=== CHECKING FOR COMPLETION_TOKENS_DETAILS ===")
-        if hasattr(completion.usage, 'completion_tokens_details'):
-            print(f"completion_tokens_details exists: {completion.usage.completion_tokens_details}")
-            details = completion.usage.completion_tokens_details
-            
-            # Check all attributes
+        completion_details = usage_dict.get('completion_tokens_details')
+        if completion_details is not None:
+            print(f"completion_tokens_details exists: {completion_details}")
             print("completion_tokens_details attributes:")
-            for attr in dir(details):
-                if not attr.startswith('_'):
-                    value = getattr(details, attr, None)
-                    print(f"  {attr}: {value}")
+            for attr, value in completion_details.items():
+                print(f"  {attr}: {value}")
         else:
             print("completion_tokens_details NOT found")
-            
+
         print("\n=== ALL USAGE ATTRIBUTES ===")
-        for attr in dir(completion.usage):
-            if not attr.startswith('_'):
-                value = getattr(completion.usage, attr, None)
-                print(f"{attr}: {value}")
-                
-        # Try to convert to dict to see raw structure
-        print("\n=== RAW USAGE DICT (if possible) ===")
+        for attr, value in usage_dict.items():
+            print(f"{attr}: {value}")
+
+        print("\n=== RAW USAGE DICT ===")
         try:
-            if hasattr(completion.usage, 'model_dump'):
-                usage_dict = completion.usage.model_dump()
-                print(json.dumps(usage_dict, indent=2))
-            elif hasattr(completion.usage, 'dict'):
-                usage_dict = completion.usage.dict()
-                print(json.dumps(usage_dict, indent=2))
+            print(json.dumps(usage_dict, indent=2, default=str))
         except Exception as e:
-            print(f"Could not convert to dict: {e}")
+            print(f"Could not serialize usage dict: {e}")
 
     except Exception as e:
         print(f"Error: {e}")
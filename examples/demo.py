@@ -3,7 +3,9 @@
 Demo script showcasing the Token Counter features.
 """
 
+import importlib
 import sys
+import time
 from pathlib import Path
 
 # Add parent directory to path
@@ -15,25 +17,44 @@ from rich.table import Table
 
 console = Console()
 
+# Section headers are constant, so build each Panel once at import instead
+# of reconstructing (and re-parsing its markup) on every run
+_API_PANEL = Panel("[bold blue]🔑 API Key Validation Demo[/bold blue]", border_style="blue")
+_FACTORY_PANEL = Panel("[bold green]🏭 Client Factory Demo[/bold green]", border_style="green")
+_RATE_PANEL = Panel("[bold yellow]⏱️ Rate Limiter Demo[/bold yellow]", border_style="yellow")
+_ANALYTICS_PANEL = Panel("[bold magenta]📊 Analytics Demo[/bold magenta]", border_style="magenta")
+
+# One import per dependency for the whole demo run: repeated sections hit
+# this dict instead of re-invoking the import machinery (pandas alone is
+# ~100ms of module init on first import)
+_modules = {}
+
+
+def _get(name):
+    """Import a module once and reuse it across demo sections"""
+    module = _modules.get(name)
+    if module is None:
+        module = _modules[name] = importlib.import_module(name)
+    return module
+
 
 def demo_api_validation():
     """Demo API key validation"""
-    console.print(Panel("[bold blue]🔑 API Key Validation Demo[/bold blue]", border_style="blue"))
+    console.print(_API_PANEL)
     
     try:
-        from config.validation import print_validation_report
-        print_validation_report()
+        _get("config.validation").print_validation_report()
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
 
 
 def demo_client_factory():
     """Demo client factory pattern"""
-    console.print(Panel("[bold green]🏭 Client Factory Demo[/bold green]", border_style="green"))
+    console.print(_FACTORY_PANEL)
     
     try:
-        from client_factory import ClientFactory
-        
+        ClientFactory = _get("client_factory").ClientFactory
+
         # Show available providers
         providers = ClientFactory.get_available_providers()
         console.print(f"Available providers: {', '.join(providers)}")
@@ -56,13 +77,10 @@ def demo_client_factory():
 
 def demo_rate_limiter():
     """Demo rate limiting"""
-    console.print(Panel("[bold yellow]⏱️ Rate Limiter Demo[/bold yellow]", border_style="yellow"))
+    console.print(_RATE_PANEL)
     
     try:
-        from utils.rate_limiter import RateLimiter
-        import time
-        
-        limiter = RateLimiter()
+        limiter = _get("utils.rate_limiter").RateLimiter()
         
         console.print("Testing rate limiting (this will take a few seconds)...")
         
@@ -80,20 +98,22 @@ def demo_rate_limiter():
 
 def demo_analytics():
     """Demo analytics capabilities"""
-    console.print(Panel("[bold magenta]📊 Analytics Demo[/bold magenta]", border_style="magenta"))
+    console.print(_ANALYTICS_PANEL)
     
     try:
-        import pandas as pd
-        from analytics.analyzer import ExperimentAnalyzer
-        
-        # Create sample data
-        sample_data = [
-            {'Vendor': 'OpenAI', 'Cost (USD)': 0.001, 'Input Tokens': 100, 'Output Tokens': 50, 'Output': 'Hello world'},
-            {'Vendor': 'Gemini', 'Cost (USD)': 0.0005, 'Input Tokens': 100, 'Output Tokens': 50, 'Output': 'Hello world'},
-            {'Vendor': 'Anthropic', 'Cost (USD)': 0.002, 'Input Tokens': 100, 'Output Tokens': 50, 'Output': 'Hello world'},
-        ]
-        
-        df = pd.DataFrame(sample_data)
+        pd = _get("pandas")
+        ExperimentAnalyzer = _get("analytics.analyzer").ExperimentAnalyzer
+
+        # Create sample data column-wise (structure-of-arrays): pandas
+        # builds each column in one shot instead of inferring dtypes from
+        # a list of per-row dicts
+        df = pd.DataFrame({
+            'Vendor': ['OpenAI', 'Gemini', 'Anthropic'],
+            'Cost (USD)': [0.001, 0.0005, 0.002],
+            'Input Tokens': [100] * 3,
+            'Output Tokens': [50] * 3,
+            'Output': ['Hello world'] * 3,
+        })
         analyzer = ExperimentAnalyzer(df)
         
         # Calculate efficiency
@@ -0,0 +1,58 @@
+"""
+Local (offline) token counting.
+
+Lets the experiment estimate input token counts without paying for API
+round trips: OpenAI-family models are counted exactly with tiktoken when
+it is installed, everything else falls back to the common ~4 characters
+per token heuristic.
+"""
+
+from functools import lru_cache
+
+# tiktoken is optional; without it every count is the chars/4 estimate
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+@lru_cache(maxsize=8)
+def _encoding_for_model(model: str):
+    """Load (once) the BPE encoding for a model, with a safe default"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Unknown model name: use the encoding shared by recent OpenAI models
+        return tiktoken.get_encoding("o200k_base")
+
+
+def is_exact(model: str) -> bool:
+    """Whether count_tokens is an exact BPE count for this model"""
+    return tiktoken is not None
+
+
+def count_tokens(text: str, model: str) -> int:
+    """
+    Count (or estimate) the tokens in one piece of text.
+
+    With tiktoken installed this is the model's real BPE count; otherwise
+    it is the standard ~4 characters/token estimate.
+    """
+    if tiktoken is not None:
+        return len(_encoding_for_model(model).encode(text))
+    return max(1, len(text) // 4)
+
+
+def count_message_tokens(prompt: str, system_prompt: str, model: str) -> int:
+    """
+    Count (or estimate) the input tokens for one chat request.
+
+    Each message carries a few tokens of framing overhead on top of its
+    content; 4 per message plus 3 for the reply priming matches OpenAI's
+    published accounting closely enough for estimation purposes.
+    """
+    total = 3  # reply priming
+    for text in (system_prompt, prompt):
+        if text:
+            total += 4 + count_tokens(text, model)
+    return total
@@ -12,17 +12,198 @@ Usage:
     python main.py --prompt "Test" --trials 1        # Multiple custom options
 """
 
+import asyncio
+import csv
+import os
+import re
+import sys
 import pandas as pd
 import argparse
+from pathlib import Path
 from config import (
     DEFAULT_USER_PROMPT, DEFAULT_SYSTEM_PROMPT, DEFAULT_NUM_TRIALS,
     CSV_OUTPUT_PATH, CSV_COLUMNS, get_timestamped_filename, MODELS_INFO,
-    ANTHROPIC_CACHE_TYPE
+    MODELS, ANTHROPIC_CACHE_TYPE
 )
-from clients.openai_client import process_with_openai, get_model_name as get_openai_model
-from clients.gemini_client import process_with_gemini, get_model_name as get_gemini_model
-from clients.anthropic_client import process_with_anthropic, get_model_name as get_anthropic_model
-from clients.grok_client import process_with_grok, get_model_name as get_grok_model
+from clients import dispatcher
+from clients.dispatcher import _get_semaphore
+from clients._http import aclose_shared_async_client
+from clients.openai_client import (
+    process_with_openai_async, _get_client as _get_openai_client,
+    get_model_name as get_openai_model
+)
+from clients.gemini_client import (
+    process_with_gemini_async, _get_client as _get_gemini_client,
+    get_model_name as get_gemini_model
+)
+from clients.anthropic_client import (
+    process_with_anthropic_async, _get_client as _get_anthropic_client,
+    get_model_name as get_anthropic_model
+)
+from clients.grok_client import (
+    process_with_grok_async, _get_client as _get_grok_client,
+    get_model_name as get_grok_model
+)
+
+# Async entry point per vendor; run_single_trial fans these out concurrently
+_ASYNC_CALLS = {
+    'openai': process_with_openai_async,
+    'gemini': process_with_gemini_async,
+    'anthropic': process_with_anthropic_async,
+    'grok': process_with_grok_async,
+}
+
+# Per-token rates precomputed once at import: the cost calculators run for
+# every API call, and re-walking MODELS_INFO's nested dicts there costs a
+# handful of hash lookups per row for values that never change
+_OPENAI_INPUT_RATE = MODELS_INFO['openai']['input_cost_per_million'] / 1_000_000
+_OPENAI_CACHED_RATE = MODELS_INFO['openai']['cached_input_cost_per_million'] / 1_000_000
+_OPENAI_OUTPUT_RATE = MODELS_INFO['openai']['output_cost_per_million'] / 1_000_000
+
+_GEMINI_TIERED = bool(MODELS_INFO['gemini'].get('tiered_pricing', False))
+_GEMINI_INPUT_RATE = MODELS_INFO['gemini']['input_cost_per_million'] / 1_000_000
+_GEMINI_CACHED_RATE = MODELS_INFO['gemini']['cached_input_cost_per_million'] / 1_000_000
+_GEMINI_OUTPUT_RATE = MODELS_INFO['gemini']['output_cost_per_million'] / 1_000_000
+if _GEMINI_TIERED:
+    _GEMINI_THRESHOLD = MODELS_INFO['gemini']['pricing_tiers']['threshold']
+    _GEMINI_LOW_RATES = (
+        MODELS_INFO['gemini']['pricing_tiers']['low_tier']['input_cost_per_million'] / 1_000_000,
+        MODELS_INFO['gemini']['pricing_tiers']['low_tier']['output_cost_per_million'] / 1_000_000,
+    )
+    _GEMINI_HIGH_RATES = (
+        MODELS_INFO['gemini']['pricing_tiers']['high_tier']['input_cost_per_million'] / 1_000_000,
+        MODELS_INFO['gemini']['pricing_tiers']['high_tier']['output_cost_per_million'] / 1_000_000,
+    )
+
+_ANTHROPIC_BASE_RATE = MODELS_INFO['anthropic']['input_cost_per_million'] / 1_000_000
+_ANTHROPIC_OUTPUT_RATE = MODELS_INFO['anthropic']['output_cost_per_million'] / 1_000_000
+if ANTHROPIC_CACHE_TYPE.lower() in MODELS_INFO['anthropic']['cache_pricing']:
+    _ANTHROPIC_CACHE_CFG = MODELS_INFO['anthropic']['cache_pricing'][ANTHROPIC_CACHE_TYPE.lower()]
+else:
+    # Fallback to ephemeral if invalid cache type (warn once, at import)
+    _ANTHROPIC_CACHE_CFG = MODELS_INFO['anthropic']['cache_pricing']['ephemeral']
+    print(f"Warning: Invalid cache type '{ANTHROPIC_CACHE_TYPE.lower()}', using ephemeral pricing")
+_ANTHROPIC_CACHE_WRITE_RATE = _ANTHROPIC_BASE_RATE * _ANTHROPIC_CACHE_CFG['cache_write_multiplier']
+_ANTHROPIC_CACHE_READ_RATE = _ANTHROPIC_BASE_RATE * _ANTHROPIC_CACHE_CFG['cache_read_multiplier']
+
+_GROK_TIERED = bool(MODELS_INFO['grok'].get('tiered_pricing', False))
+_GROK_INPUT_RATE = MODELS_INFO['grok']['input_cost_per_million'] / 1_000_000
+_GROK_CACHED_RATE = MODELS_INFO['grok']['cached_input_cost_per_million'] / 1_000_000
+_GROK_OUTPUT_RATE = MODELS_INFO['grok']['output_cost_per_million'] / 1_000_000
+if _GROK_TIERED:
+    _GROK_THRESHOLD = MODELS_INFO['grok']['pricing_tiers']['threshold']
+    _GROK_STANDARD_RATES = (
+        MODELS_INFO['grok']['pricing_tiers']['standard_tier']['input_cost_per_million'] / 1_000_000,
+        MODELS_INFO['grok']['pricing_tiers']['standard_tier']['cached_input_cost_per_million'] / 1_000_000,
+        MODELS_INFO['grok']['pricing_tiers']['standard_tier']['output_cost_per_million'] / 1_000_000,
+    )
+    _GROK_HIGHER_RATES = (
+        MODELS_INFO['grok']['pricing_tiers']['higher_context_tier']['input_cost_per_million'] / 1_000_000,
+        MODELS_INFO['grok']['pricing_tiers']['higher_context_tier']['cached_input_cost_per_million'] / 1_000_000,
+        MODELS_INFO['grok']['pricing_tiers']['higher_context_tier']['output_cost_per_million'] / 1_000_000,
+    )
+
+# Suppresses the per-call cost breakdowns (--quiet); on large --trials runs
+# the three-line breakdown per API call dominates terminal time
+_QUIET = False
+
+
+def _progress(message):
+    """Print one per-call progress block unless --quiet is active"""
+    if not _QUIET:
+        print(message)
+
+
+# Module-level client getters, used to pre-warm the same instances the
+# async entry points above call into
+_CLIENT_GETTERS = {
+    'openai': _get_openai_client,
+    'gemini': _get_gemini_client,
+    'anthropic': _get_anthropic_client,
+    'grok': _get_grok_client,
+}
+
+
+class ResultBuffer:
+    """
+    Columnar accumulator for trial results.
+
+    Keeps one list per CSV column (structure-of-arrays) so the final
+    DataFrame is assembled from whole columns in one shot instead of
+    pandas re-walking a list of per-row dicts.
+    """
+
+    # Token columns tracked incrementally for the summary
+    _TOKEN_COLS = ('Input Tokens', 'Cached Input Tokens', 'Output Tokens')
+
+    # Explicit dtypes for the numeric columns: nullable Int64/Float64 keep
+    # error rows' missing counts as NA instead of forcing everything to
+    # object dtype, and skip pandas' per-value type inference entirely
+    _DTYPES = {
+        'Run Number': 'int64',
+        'Input Tokens': 'Int64',
+        'Cached Input Tokens': 'Int64',
+        'Output Tokens': 'Int64',
+        'Reasoning Tokens': 'Int64',
+        'Input Token Cost (USD)': 'Float64',
+        'Cached Token Cost (USD)': 'Float64',
+        'Output Token Cost (USD)': 'Float64',
+        'Reasoning Token Cost (USD)': 'Float64',
+        'Cost (USD)': 'Float64',
+        'Error': 'bool',
+    }
+
+    def __init__(self, columns=CSV_COLUMNS):
+        self.columns = list(columns)
+        self._data = {col: [] for col in self.columns}
+        self._length = 0
+        # Per-(vendor, column) running [count, mean, sum], updated as rows
+        # arrive; the mean uses Welford's online update so the summary costs
+        # O(1) instead of a full groupby scan at the end
+        self._token_stats = {}
+
+    def __len__(self):
+        return self._length
+
+    def append(self, row):
+        """Add a single result row (dict keyed by CSV column names)"""
+        for col in self.columns:
+            self._data[col].append(row.get(col))
+        self._length += 1
+
+        if not row.get('Error'):
+            vendor_stats = self._token_stats.setdefault(
+                row['Vendor'], {col: [0, 0.0, 0] for col in self._TOKEN_COLS}
+            )
+            for col in self._TOKEN_COLS:
+                value = row.get(col) or 0
+                stats = vendor_stats[col]
+                stats[0] += 1
+                stats[1] += (value - stats[1]) / stats[0]
+                stats[2] += value
+
+    def token_stats(self):
+        """Running per-vendor token statistics: {vendor: {col: (count, mean, sum)}}"""
+        return {
+            vendor: {col: tuple(stats) for col, stats in cols.items()}
+            for vendor, cols in self._token_stats.items()
+        }
+
+    def extend(self, rows):
+        """Add a list of result rows"""
+        for row in rows:
+            self.append(row)
+
+    def to_dataframe(self):
+        """Build the results DataFrame from the accumulated, typed columns"""
+        return pd.DataFrame(
+            {
+                col: pd.array(values, dtype=self._DTYPES[col])
+                     if col in self._DTYPES else values
+                for col, values in self._data.items()
+            },
+            columns=self.columns,
+        )
 
 
 def format_cost(cost_value):
@@ -46,37 +227,28 @@ def calculate_gemini_tiered_cost(input_tokens, cached_tokens, output_tokens):
     Returns:
         tuple: (input_cost, cached_cost, output_cost, total_cost)
     """
-    gemini_config = MODELS_INFO['gemini']
-
     # Check if this model uses tiered pricing
-    if not gemini_config.get('tiered_pricing', False):
+    if not _GEMINI_TIERED:
         # Fall back to simple pricing
         regular_input_tokens = input_tokens - cached_tokens
-        input_cost = regular_input_tokens * gemini_config['input_cost_per_million'] / 1_000_000
-        cached_cost = cached_tokens * gemini_config['cached_input_cost_per_million'] / 1_000_000
-        output_cost = output_tokens * gemini_config['output_cost_per_million'] / 1_000_000
+        input_cost = regular_input_tokens * _GEMINI_INPUT_RATE
+        cached_cost = cached_tokens * _GEMINI_CACHED_RATE
+        output_cost = output_tokens * _GEMINI_OUTPUT_RATE
         return input_cost, cached_cost, output_cost, input_cost + cached_cost + output_cost
-    
-    # Tiered pricing calculation
-    pricing_tiers = gemini_config['pricing_tiers']
-    threshold = pricing_tiers['threshold']
+
+    # Tiered pricing: pick the tier from the total token count (low tier
+    # <=200K tokens, high tier above)
     total_tokens = input_tokens + output_tokens
-    
-    # Determine which tier to use based on total token count
-    if total_tokens <= threshold:
-        # Low tier (<=200K tokens)
-        tier = pricing_tiers['low_tier']
-    else:
-        # High tier (>200K tokens)
-        tier = pricing_tiers['high_tier']
-    
-    # Calculate costs using the appropriate tier
+    input_rate, output_rate = (
+        _GEMINI_LOW_RATES if total_tokens <= _GEMINI_THRESHOLD else _GEMINI_HIGH_RATES
+    )
+
     # For Gemini 2.5 Pro: charge full price for all input tokens (no caching discount)
     # but still track and display cached token counts when they appear
-    input_cost = input_tokens * tier['input_cost_per_million'] / 1_000_000
+    input_cost = input_tokens * input_rate
     cached_cost = 0.0  # Unknown pricing for cached tokens (not documented by Google)
-    output_cost = output_tokens * tier['output_cost_per_million'] / 1_000_000
-    
+    output_cost = output_tokens * output_rate
+
     return input_cost, cached_cost, output_cost, input_cost + cached_cost + output_cost
 
 
@@ -93,38 +265,29 @@ def calculate_gemini_tiered_cost_with_reasoning(input_tokens, cached_tokens, out
     Returns:
         tuple: (input_cost, cached_cost, output_cost, reasoning_cost, total_cost)
     """
-    gemini_config = MODELS_INFO['gemini']
-
     # Check if this model uses tiered pricing
-    if not gemini_config.get('tiered_pricing', False):
+    if not _GEMINI_TIERED:
         # Fall back to simple pricing
         regular_input_tokens = input_tokens - cached_tokens
-        input_cost = regular_input_tokens * gemini_config['input_cost_per_million'] / 1_000_000
-        cached_cost = cached_tokens * gemini_config['cached_input_cost_per_million'] / 1_000_000
-        output_cost = output_tokens * gemini_config['output_cost_per_million'] / 1_000_000
-        reasoning_cost = reasoning_tokens * gemini_config['output_cost_per_million'] / 1_000_000  # Reasoning charged at output rate
+        input_cost = regular_input_tokens * _GEMINI_INPUT_RATE
+        cached_cost = cached_tokens * _GEMINI_CACHED_RATE
+        output_cost = output_tokens * _GEMINI_OUTPUT_RATE
+        reasoning_cost = reasoning_tokens * _GEMINI_OUTPUT_RATE  # Reasoning charged at output rate
         return input_cost, cached_cost, output_cost, reasoning_cost, input_cost + cached_cost + output_cost + reasoning_cost
 
-    # Tiered pricing calculation
-    pricing_tiers = gemini_config['pricing_tiers']
-    threshold = pricing_tiers['threshold']
+    # Tiered pricing: pick the tier from the total token count (low tier
+    # ≤200K tokens, high tier above), with reasoning tokens included
     total_tokens = input_tokens + output_tokens + reasoning_tokens
+    input_rate, output_rate = (
+        _GEMINI_LOW_RATES if total_tokens <= _GEMINI_THRESHOLD else _GEMINI_HIGH_RATES
+    )
 
-    # Determine which tier to use based on total token count
-    if total_tokens <= threshold:
-        # Low tier (≤200K tokens)
-        tier = pricing_tiers['low_tier']
-    else:
-        # High tier (>200K tokens)
-        tier = pricing_tiers['high_tier']
-
-    # Calculate costs using the appropriate tier
     # For Gemini 2.5 Pro: charge full price for all input tokens (no caching discount)
     # but still track and display cached token counts when they appear
-    input_cost = input_tokens * tier['input_cost_per_million'] / 1_000_000
+    input_cost = input_tokens * input_rate
     cached_cost = 0.0  # Unknown pricing for cached tokens (not documented by Google)
-    output_cost = output_tokens * tier['output_cost_per_million'] / 1_000_000
-    reasoning_cost = reasoning_tokens * tier['output_cost_per_million'] / 1_000_000  # Reasoning charged at output rate
+    output_cost = output_tokens * output_rate
+    reasoning_cost = reasoning_tokens * output_rate  # Reasoning charged at output rate
 
     return input_cost, cached_cost, output_cost, reasoning_cost, input_cost + cached_cost + output_cost + reasoning_cost
 
@@ -142,34 +305,20 @@ def calculate_anthropic_cache_cost(input_tokens, cache_creation_tokens, cache_re
     Returns:
         tuple: (regular_input_cost, cache_creation_cost, cache_read_cost, output_cost, total_cost)
     """
-    anthropic_config = MODELS_INFO['anthropic']
-    cache_type = ANTHROPIC_CACHE_TYPE.lower()
-    
-    # Get cache pricing for the configured type
-    if cache_type in anthropic_config['cache_pricing']:
-        cache_config = anthropic_config['cache_pricing'][cache_type]
-    else:
-        # Fallback to ephemeral if invalid cache type
-        cache_config = anthropic_config['cache_pricing']['ephemeral']
-        print(f"Warning: Invalid cache type '{cache_type}', using ephemeral pricing")
-    
     # Calculate regular input tokens (total - cache creation - cache read)
     regular_input_tokens = max(input_tokens - cache_creation_tokens - cache_read_tokens, 0)
-    
-    # Base rate for calculations
-    base_rate = anthropic_config['input_cost_per_million'] / 1_000_000
-    
-    # Calculate costs using configured cache type
-    regular_input_cost = regular_input_tokens * base_rate
-    cache_creation_cost = cache_creation_tokens * base_rate * cache_config['cache_write_multiplier']
-    cache_read_cost = cache_read_tokens * base_rate * cache_config['cache_read_multiplier']
-    output_cost = output_tokens * anthropic_config['output_cost_per_million'] / 1_000_000
-    
+
+    # Calculate costs using the rates precomputed for the configured cache type
+    regular_input_cost = regular_input_tokens * _ANTHROPIC_BASE_RATE
+    cache_creation_cost = cache_creation_tokens * _ANTHROPIC_CACHE_WRITE_RATE
+    cache_read_cost = cache_read_tokens * _ANTHROPIC_CACHE_READ_RATE
+    output_cost = output_tokens * _ANTHROPIC_OUTPUT_RATE
+
     # Note: Storage cost for persistent caching not implemented yet (requires time tracking)
     # storage_cost = cache_creation_tokens * cache_config['storage_cost_per_million_per_hour'] / 1_000_000 * hours
-    
+
     total_cost = regular_input_cost + cache_creation_cost + cache_read_cost + output_cost
-    
+
     return regular_input_cost, cache_creation_cost, cache_read_cost, output_cost, total_cost
 
 
@@ -185,36 +334,28 @@ def calculate_grok_tiered_cost(input_tokens, cached_tokens, output_tokens):
     Returns:
         tuple: (input_cost, cached_cost, output_cost, total_cost)
     """
-    grok_config = MODELS_INFO['grok']
-    
     # Check if this model uses tiered pricing
-    if not grok_config.get('tiered_pricing', False):
+    if not _GROK_TIERED:
         # Fall back to simple pricing
         regular_input_tokens = input_tokens - cached_tokens
-        input_cost = regular_input_tokens * grok_config['input_cost_per_million'] / 1_000_000
-        cached_cost = cached_tokens * grok_config['cached_input_cost_per_million'] / 1_000_000
-        output_cost = output_tokens * grok_config['output_cost_per_million'] / 1_000_000
+        input_cost = regular_input_tokens * _GROK_INPUT_RATE
+        cached_cost = cached_tokens * _GROK_CACHED_RATE
+        output_cost = output_tokens * _GROK_OUTPUT_RATE
         return input_cost, cached_cost, output_cost, input_cost + cached_cost + output_cost
-    
-    # Tiered pricing calculation
-    pricing_tiers = grok_config['pricing_tiers']
-    threshold = pricing_tiers['threshold']
+
+    # Tiered pricing: pick the tier from the total context size (standard
+    # tier ≤128K tokens, higher context above)
     total_context_tokens = input_tokens + output_tokens  # Total context size
-    
-    # Determine which tier to use based on total context size
-    if total_context_tokens <= threshold:
-        # Standard tier (≤128K tokens)
-        tier = pricing_tiers['standard_tier']
-    else:
-        # Higher context tier (>128K tokens)
-        tier = pricing_tiers['higher_context_tier']
-    
+    input_rate, cached_rate, output_rate = (
+        _GROK_STANDARD_RATES if total_context_tokens <= _GROK_THRESHOLD else _GROK_HIGHER_RATES
+    )
+
     # Calculate costs using the appropriate tier
     regular_input_tokens = input_tokens - cached_tokens
-    input_cost = regular_input_tokens * tier['input_cost_per_million'] / 1_000_000
-    cached_cost = cached_tokens * tier['cached_input_cost_per_million'] / 1_000_000
-    output_cost = output_tokens * tier['output_cost_per_million'] / 1_000_000
-    
+    input_cost = regular_input_tokens * input_rate
+    cached_cost = cached_tokens * cached_rate
+    output_cost = output_tokens * output_rate
+
     return input_cost, cached_cost, output_cost, input_cost + cached_cost + output_cost
 
 
@@ -231,315 +372,472 @@ def calculate_grok_tiered_cost_with_reasoning(input_tokens, cached_tokens, outpu
     Returns:
         tuple: (input_cost, cached_cost, output_cost, reasoning_cost, total_cost)
     """
-    grok_config = MODELS_INFO['grok']
-    
     # Check if this model uses tiered pricing
-    if not grok_config.get('tiered_pricing', False):
+    if not _GROK_TIERED:
         # Fall back to simple pricing
         regular_input_tokens = input_tokens - cached_tokens
-        input_cost = regular_input_tokens * grok_config['input_cost_per_million'] / 1_000_000
-        cached_cost = cached_tokens * grok_config['cached_input_cost_per_million'] / 1_000_000
-        output_cost = output_tokens * grok_config['output_cost_per_million'] / 1_000_000
-        reasoning_cost = reasoning_tokens * grok_config['output_cost_per_million'] / 1_000_000  # Reasoning charged at output rate
+        input_cost = regular_input_tokens * _GROK_INPUT_RATE
+        cached_cost = cached_tokens * _GROK_CACHED_RATE
+        output_cost = output_tokens * _GROK_OUTPUT_RATE
+        reasoning_cost = reasoning_tokens * _GROK_OUTPUT_RATE  # Reasoning charged at output rate
         return input_cost, cached_cost, output_cost, reasoning_cost, input_cost + cached_cost + output_cost + reasoning_cost
 
-    # Tiered pricing calculation
-    pricing_tiers = grok_config['pricing_tiers']
-    threshold = pricing_tiers['threshold']
-    total_context_tokens = input_tokens + output_tokens + reasoning_tokens  # Include reasoning in context calculation
-
-    # Determine which tier to use based on total context size
-    if total_context_tokens <= threshold:
-        # Standard tier (≤128K tokens)
-        tier = pricing_tiers['standard_tier']
-    else:
-        # Higher context tier (>128K tokens)
-        tier = pricing_tiers['higher_context_tier']
+    # Tiered pricing: pick the tier from the total context size (standard
+    # tier ≤128K tokens, higher context above), with reasoning included
+    total_context_tokens = input_tokens + output_tokens + reasoning_tokens
+    input_rate, cached_rate, output_rate = (
+        _GROK_STANDARD_RATES if total_context_tokens <= _GROK_THRESHOLD else _GROK_HIGHER_RATES
+    )
 
     # Calculate costs using the appropriate tier
     regular_input_tokens = input_tokens - cached_tokens
-    input_cost = regular_input_tokens * tier['input_cost_per_million'] / 1_000_000
-    cached_cost = cached_tokens * tier['cached_input_cost_per_million'] / 1_000_000
-    output_cost = output_tokens * tier['output_cost_per_million'] / 1_000_000
-    reasoning_cost = reasoning_tokens * tier['output_cost_per_million'] / 1_000_000  # Reasoning charged at output rate
+    input_cost = regular_input_tokens * input_rate
+    cached_cost = cached_tokens * cached_rate
+    output_cost = output_tokens * output_rate
+    reasoning_cost = reasoning_tokens * output_rate  # Reasoning charged at output rate
 
     return input_cost, cached_cost, output_cost, reasoning_cost, input_cost + cached_cost + output_cost + reasoning_cost
 
 
-def run_single_trial(prompt, system_prompt, trial_number, vendors=None):
+# Providers only cache prompt prefixes above a minimum size; below it the
+# cached-token columns stay 0 no matter how many trials repeat the prompt
+_CACHE_MIN_TOKENS = {'openai': 1024, 'anthropic': 1024, 'gemini': 4096}
+
+
+def _warn_below_cache_minimum(prompt, system_prompt, vendors):
+    """
+    Note upfront when the prompt is too short for provider prompt caching.
+
+    Uses the local (cached) tokenizer for a one-off estimate, so users
+    aren't left wondering why the cache-hit columns are all zero on a
+    short-prompt run.
+    """
+    from local_token_counter import count_message_tokens
+
+    estimate = count_message_tokens(prompt, system_prompt, MODELS['openai'])
+    too_short = [
+        f"{vendor.capitalize()} ({minimum})"
+        for vendor, minimum in _CACHE_MIN_TOKENS.items()
+        if vendor in vendors and estimate < minimum
+    ]
+    if too_short:
+        print(f"  Note: prompt is ~{estimate} tokens, below the prompt-cache "
+              f"minimum for {', '.join(too_short)}; expect zero cached tokens there.")
+
+
+async def prewarm_clients(vendors):
+    """
+    Open HTTPS connections to the selected vendors before the first trial.
+
+    Each client issues a cheap model-listing request concurrently, so the
+    DNS+TCP+TLS setup for all vendors overlaps in one pre-warm phase and the
+    first real completion reuses an already-open connection. Strictly
+    best-effort: a vendor whose pre-warm fails (bad key, network blip) just
+    pays the handshake on its first real call instead.
+    """
+    async def _warm(vendor):
+        await _CLIENT_GETTERS[vendor]().prewarm_async()
+
+    await asyncio.gather(
+        *(_warm(vendor) for vendor in vendors if vendor in _CLIENT_GETTERS),
+        return_exceptions=True
+    )
+
+
+async def _call_vendor_limited(vendor, prompt, system_prompt):
+    """Call one vendor's async entry point, bounded by its semaphore.
+
+    The per-vendor semaphores (shared with clients.dispatcher) cap in-flight
+    requests per provider, so running many trials concurrently cannot blow
+    through a vendor's rate limit.
+    """
+    async with _get_semaphore(vendor):
+        return await _ASYNC_CALLS[vendor](prompt, system_prompt)
+
+
+def _make_row(trial_number, vendor, model, prompt, system_prompt, output,
+              input_tokens, cached_input_tokens, output_tokens, reasoning_tokens,
+              input_cost, cached_cost, output_cost, reasoning_cost, total_cost,
+              error=False):
+    """Assemble one result dict keyed by the CSV columns"""
+    return {
+        'Run Number': trial_number,
+        'Vendor': vendor,
+        'Model': model,
+        'User Prompt': prompt,
+        'System Prompt': system_prompt,
+        'Output': output,
+        'Input Tokens': input_tokens,
+        'Cached Input Tokens': cached_input_tokens,
+        'Output Tokens': output_tokens,
+        'Reasoning Tokens': reasoning_tokens,
+        'Input Token Cost (USD)': input_cost,
+        'Cached Token Cost (USD)': cached_cost,
+        'Output Token Cost (USD)': output_cost,
+        'Reasoning Token Cost (USD)': reasoning_cost,
+        'Cost (USD)': total_cost,
+        'Error': error
+    }
+
+
+def _openai_row(outcome, trial_number, prompt, system_prompt):
+    """Build the OpenAI result row: flat pricing with a cached-input discount"""
+    output, in_tok, cached_in_tok, out_tok, reasoning_tok = outcome
+    # Raw token counts - no calculations
+    input_tokens = in_tok or 0
+    cached_input_tokens = int(cached_in_tok) if cached_in_tok is not None else 0
+    output_tokens = out_tok or 0
+    reasoning_tokens = reasoning_tok or 0
+
+    # Cost calculation: uncached = total - cached, cached = cached
+    uncached_input = max(input_tokens - cached_input_tokens, 0)
+    input_token_cost = uncached_input * _OPENAI_INPUT_RATE
+    cached_token_cost = cached_input_tokens * _OPENAI_CACHED_RATE
+    output_token_cost = output_tokens * _OPENAI_OUTPUT_RATE
+    reasoning_token_cost = reasoning_tokens * _OPENAI_OUTPUT_RATE  # Reasoning charged at output rate
+    cost = input_token_cost + cached_token_cost + output_token_cost + reasoning_token_cost
+
+    # Display detailed cost breakdown during run (one write per call)
+    if reasoning_tokens > 0:
+        total_billable_tokens = input_tokens + output_tokens + reasoning_tokens
+        _progress(
+            f"  ✅ OpenAI:\n"
+            f"     Tokens: {total_billable_tokens} total ({uncached_input} uncached + "
+            f"{cached_input_tokens} cached + {output_tokens} output + {reasoning_tokens} reasoning)\n"
+            f"     Costs: ${input_token_cost:.6f} uncached + ${cached_token_cost:.6f} cached + "
+            f"${output_token_cost:.6f} output + ${reasoning_token_cost:.6f} reasoning = ${cost:.6f} total"
+        )
+    else:
+        _progress(
+            f"  ✅ OpenAI:\n"
+            f"     Tokens: {input_tokens} total in ({uncached_input} uncached + "
+            f"{cached_input_tokens} cached) + {output_tokens} out\n"
+            f"     Costs: ${input_token_cost:.6f} uncached + ${cached_token_cost:.6f} cached + "
+            f"${output_token_cost:.6f} output = ${cost:.6f} total"
+        )
+
+    return _make_row(
+        trial_number, 'OpenAI', get_openai_model(), prompt, system_prompt, output,
+        input_tokens, cached_input_tokens, output_tokens, reasoning_tokens,
+        format_cost(input_token_cost), format_cost(cached_token_cost),
+        format_cost(output_token_cost), format_cost(reasoning_token_cost),
+        format_cost(cost)
+    )
+
+
+def _gemini_row(outcome, trial_number, prompt, system_prompt):
+    """Build the Gemini result row: tiered pricing including reasoning tokens"""
+    output, in_tok, cached_in_tok, out_tok, reasoning_tok = outcome
+    total_input_tokens = in_tok or 0
+    cached_input_tokens = cached_in_tok or 0
+    regular_input_tokens = total_input_tokens - cached_input_tokens
+    output_tokens = out_tok or 0
+    reasoning_tokens = reasoning_tok or 0
+
+    # Cost calculation using tiered pricing INCLUDING reasoning tokens
+    regular_input_cost, cached_input_cost, output_cost, reasoning_cost, total_cost = calculate_gemini_tiered_cost_with_reasoning(
+        total_input_tokens, cached_input_tokens, output_tokens, reasoning_tokens
+    )
+
+    # Display detailed cost breakdown during run (one write per call)
+    total_billable_tokens = total_input_tokens + output_tokens + reasoning_tokens
+    if reasoning_tokens > 0:
+        _progress(
+            f"  ✅ Gemini:\n"
+            f"     Tokens: {total_billable_tokens} total ({regular_input_tokens} uncached + "
+            f"{cached_input_tokens} cached + {output_tokens} output + {reasoning_tokens} reasoning)\n"
+            f"     Costs: ${regular_input_cost:.6f} uncached + ${cached_input_cost:.6f} cached + "
+            f"${output_cost:.6f} output + ${reasoning_cost:.6f} reasoning = ${total_cost:.6f} total"
+        )
+    else:
+        _progress(
+            f"  ✅ Gemini:\n"
+            f"     Tokens: {total_input_tokens} total in ({regular_input_tokens} uncached + "
+            f"{cached_input_tokens} cached) + {output_tokens} out\n"
+            f"     Costs: ${regular_input_cost:.6f} uncached + ${cached_input_cost:.6f} cached + "
+            f"${output_cost:.6f} output = ${total_cost:.6f} total"
+        )
+
+    return _make_row(
+        trial_number, 'Gemini', get_gemini_model(), prompt, system_prompt, output,
+        total_input_tokens, cached_input_tokens, output_tokens, reasoning_tokens,
+        format_cost(regular_input_cost), format_cost(cached_input_cost),
+        format_cost(output_cost), format_cost(reasoning_cost),
+        format_cost(total_cost)
+    )
+
+
+def _anthropic_row(outcome, trial_number, prompt, system_prompt):
+    """Build the Anthropic result row: cache-write/read pricing, no reasoning"""
+    output, in_tok, cache_creation_tok, cache_read_tok, out_tok = outcome
+    # Raw token counts from Claude API
+    input_tokens = in_tok or 0
+    cache_creation_tokens = cache_creation_tok or 0
+    cache_read_tokens = cache_read_tok or 0
+    output_tokens = out_tok or 0
+
+    # Use configured cache type for cost calculation
+    regular_input_cost, cache_creation_cost, cache_read_cost, output_token_cost, cost = calculate_anthropic_cache_cost(
+        input_tokens, cache_creation_tokens, cache_read_tokens, output_tokens
+    )
+
+    # Display detailed cost breakdown during run
+    total_cached_tokens = cache_creation_tokens + cache_read_tokens
+    regular_input_tokens = max(input_tokens - cache_creation_tokens - cache_read_tokens, 0)
+    _progress(
+        f"  ✅ Anthropic:\n"
+        f"     Tokens: {input_tokens} total in ({regular_input_tokens} regular + "
+        f"{cache_creation_tokens} cache-write + {cache_read_tokens} cache-read) + {output_tokens} out\n"
+        f"     Costs: ${regular_input_cost:.6f} regular + ${cache_creation_cost:.6f} cache-write + "
+        f"${cache_read_cost:.6f} cache-read + ${output_token_cost:.6f} output = ${cost:.6f} total"
+    )
+
+    return _make_row(
+        trial_number, 'Anthropic', get_anthropic_model(), prompt, system_prompt, output,
+        input_tokens, total_cached_tokens, output_tokens, 0,  # Anthropic doesn't use reasoning tokens
+        format_cost(regular_input_cost), format_cost(cache_creation_cost + cache_read_cost),
+        format_cost(output_token_cost), 0.0,  # No reasoning cost for Anthropic
+        format_cost(cost)
+    )
+
+
+def _grok_row(outcome, trial_number, prompt, system_prompt):
+    """Build the Grok result row: tiered pricing including reasoning tokens"""
+    output, in_tok, cached_in_tok, out_tok, reasoning_tok = outcome
+    # Raw token counts - no calculations
+    input_tokens = in_tok or 0
+    cached_input_tokens = int(cached_in_tok) if cached_in_tok is not None else 0
+    output_tokens = out_tok or 0
+    reasoning_tokens = reasoning_tok or 0
+
+    # Use tiered pricing for cost calculation INCLUDING reasoning tokens
+    input_token_cost, cached_token_cost, output_token_cost, reasoning_token_cost, cost = calculate_grok_tiered_cost_with_reasoning(
+        input_tokens, cached_input_tokens, output_tokens, reasoning_tokens
+    )
+
+    # Display detailed cost breakdown during run
+    uncached_input = max(input_tokens - cached_input_tokens, 0)
+    total_billable_tokens = input_tokens + output_tokens + reasoning_tokens
+    _progress(
+        f"  ✅ Grok:\n"
+        f"     Tokens: {total_billable_tokens} total ({uncached_input} uncached + "
+        f"{cached_input_tokens} cached + {output_tokens} output + {reasoning_tokens} reasoning)\n"
+        f"     Costs: ${input_token_cost:.6f} uncached + ${cached_token_cost:.6f} cached + "
+        f"${output_token_cost:.6f} output + ${reasoning_token_cost:.6f} reasoning = ${cost:.6f} total"
+    )
+
+    return _make_row(
+        trial_number, 'Grok', get_grok_model(), prompt, system_prompt, output,
+        input_tokens, cached_input_tokens, output_tokens, reasoning_tokens,
+        format_cost(input_token_cost), format_cost(cached_token_cost),
+        format_cost(output_token_cost), format_cost(reasoning_token_cost),
+        format_cost(cost)
+    )
+
+
+# One entry per vendor: (key, display name, model getter, success-row builder).
+# run_single_trial iterates this instead of four copy-pasted try/except
+# blocks, so row assembly and error handling live in one place.
+_VENDOR_ROWS = (
+    ('openai', 'OpenAI', get_openai_model, _openai_row),
+    ('gemini', 'Gemini', get_gemini_model, _gemini_row),
+    ('anthropic', 'Anthropic', get_anthropic_model, _anthropic_row),
+    ('grok', 'Grok', get_grok_model, _grok_row),
+)
+
+
+# Instruction prepended to a batched request so the single completion can be
+# split back into per-trial answers
+_BATCH_INSTRUCTION = (
+    "Answer each of the following numbered queries independently. "
+    "Prefix each answer with its number in square brackets, e.g. '[1]', on its own line."
+)
+
+# Matches the '[i]' answer markers in a batched completion
+_BATCH_ANSWER_RE = re.compile(r"(?m)^\[(\d+)\]\s*")
+
+
+async def _call_vendor_batch(vendor, prompts, system_prompt):
+    """
+    Answer several trials' prompts with a single API call to one vendor.
+
+    The prompts are marshalled into one numbered request, and the combined
+    completion is split back into per-trial outputs. This amortizes the
+    round trip and the system-prompt token cost across the batch, at the
+    cost of approximate accounting: the call's token counts are divided
+    evenly across the trials (matching BaseLLMClient.process_batch).
+
+    Returns:
+        list: One result tuple per prompt, shaped like the vendor's normal
+        return tuple. If the completion cannot be split (error response or
+        a model that ignored the numbering), the whole-call tuple is
+        replicated to every trial so nothing is silently dropped.
+    """
+    batch_prompt = "\n".join(
+        [_BATCH_INSTRUCTION] + [f"[{i}] {p}" for i, p in enumerate(prompts, 1)]
+    )
+    result = await _call_vendor_limited(vendor, batch_prompt, system_prompt)
+
+    k = len(prompts)
+    output = result[0]
+    parts = _BATCH_ANSWER_RE.split(output) if isinstance(output, str) else []
+    answers = {int(number): text.strip() for number, text in zip(parts[1::2], parts[2::2])}
+    if not answers:
+        return [result] * k
+
+    def _share(value):
+        return value // k if isinstance(value, int) else value
+
+    per_trial_counts = tuple(_share(value) for value in result[1:])
+    return [(answers.get(i, ""),) + per_trial_counts for i in range(1, k + 1)]
+
+
+async def run_single_trial(prompt, system_prompt, trial_number, vendors=None, outcomes=None):
     """
     Run a single trial across selected LLM providers.
-    
+
+    The vendor calls are network-bound, so they are fanned out concurrently
+    with asyncio.gather: trial wall time is bounded by the slowest vendor
+    instead of the sum of all four latencies. Results are still assembled in
+    the fixed vendor order regardless of completion order.
+
     Args:
         prompt (str): The user prompt
         system_prompt (str): The system prompt
         trial_number (int): The trial number
         vendors (list or None): List of vendors to run (default: all)
-    
+        outcomes (dict or None): Precomputed per-vendor result tuples (from
+            the batched path); when given, no API calls are made and the
+            rows are assembled directly from them
+
     Returns:
         list: List of result dictionaries
     """
     results = []
+    # Every row in this trial (and every other trial) stores these same two
+    # strings; interning makes all the row dicts share one object apiece
+    prompt = sys.intern(prompt)
+    system_prompt = sys.intern(system_prompt)
     vendors = [v.lower() for v in vendors] if vendors else ['openai', 'gemini', 'anthropic', 'grok']
-    if 'openai' in vendors:
+    if outcomes is None:
+        tasks = {
+            vendor: asyncio.create_task(_call_vendor_limited(vendor, prompt, system_prompt))
+            for vendor in vendors if vendor in _ASYNC_CALLS
+        }
+        outcomes = dict(zip(tasks, await asyncio.gather(*tasks.values(), return_exceptions=True)))
+    for key, name, model_fn, build_row in _VENDOR_ROWS:
+        if key not in outcomes:
+            continue
         try:
-            output, in_tok, cached_in_tok, out_tok, reasoning_tok = process_with_openai(prompt, system_prompt)
-            # Raw token counts - no calculations
-            input_tokens = in_tok or 0
-            cached_input_tokens = int(cached_in_tok) if cached_in_tok is not None else 0
-            output_tokens = out_tok or 0
-            reasoning_tokens = reasoning_tok or 0
-            
-            # Cost calculation: uncached = total - cached, cached = cached
-            uncached_input = max(input_tokens - cached_input_tokens, 0)
-            input_token_cost = uncached_input * MODELS_INFO['openai']['input_cost_per_million'] / 1_000_000
-            cached_token_cost = cached_input_tokens * MODELS_INFO['openai']['cached_input_cost_per_million'] / 1_000_000
-            output_token_cost = output_tokens * MODELS_INFO['openai']['output_cost_per_million'] / 1_000_000
-            reasoning_token_cost = reasoning_tokens * MODELS_INFO['openai']['output_cost_per_million'] / 1_000_000  # Reasoning charged at output rate
-            cost = input_token_cost + cached_token_cost + output_token_cost + reasoning_token_cost
-            
-            # Display detailed cost breakdown during run
-            print(f"  ✅ OpenAI:")
-            if reasoning_tokens > 0:
-                total_billable_tokens = input_tokens + output_tokens + reasoning_tokens
-                print(f"     Tokens: {total_billable_tokens} total ({uncached_input} uncached + "
-                      f"{cached_input_tokens} cached + {output_tokens} output + {reasoning_tokens} reasoning)")
-                print(f"     Costs: ${input_token_cost:.6f} uncached + ${cached_token_cost:.6f} cached + "
-                      f"${output_token_cost:.6f} output + ${reasoning_token_cost:.6f} reasoning = ${cost:.6f} total")
-            else:
-                print(f"     Tokens: {input_tokens} total in ({uncached_input} uncached + "
-                      f"{cached_input_tokens} cached) + {output_tokens} out")
-                print(f"     Costs: ${input_token_cost:.6f} uncached + ${cached_token_cost:.6f} cached + "
-                      f"${output_token_cost:.6f} output = ${cost:.6f} total")
-            
-            results.append({
-                'Run Number': trial_number,
-                'Vendor': 'OpenAI',
-                'Model': get_openai_model(),
-                'User Prompt': prompt,
-                'System Prompt': system_prompt,
-                'Output': output,
-                'Input Tokens': input_tokens,
-                'Cached Input Tokens': cached_input_tokens,
-                'Output Tokens': output_tokens,
-                'Reasoning Tokens': reasoning_tokens,  # Now tracking OpenAI reasoning tokens
-                'Input Token Cost (USD)': format_cost(input_token_cost),
-                'Cached Token Cost (USD)': format_cost(cached_token_cost),
-                'Output Token Cost (USD)': format_cost(output_token_cost),
-                'Reasoning Token Cost (USD)': format_cost(reasoning_token_cost),  # Now tracking reasoning cost
-                'Cost (USD)': format_cost(cost)
-            })
+            outcome = outcomes[key]
+            if isinstance(outcome, BaseException):
+                raise outcome
+            results.append(build_row(outcome, trial_number, prompt, system_prompt))
         except Exception as e:
-            results.append({
-                'Run Number': trial_number,
-                'Vendor': 'OpenAI',
-                'Model': get_openai_model(),
-                'User Prompt': prompt,
-                'System Prompt': system_prompt,
-                'Output': f"Error: {str(e)}",
-                'Input Tokens': None,
-                'Cached Input Tokens': 0,
-                'Output Tokens': None,
-                'Reasoning Tokens': 0,
-                'Input Token Cost (USD)': None,
-                'Cached Token Cost (USD)': None,
-                'Output Token Cost (USD)': None,
-                'Reasoning Token Cost (USD)': None,
-                'Cost (USD)': None
-            })
-    if 'gemini' in vendors:
-        try:
-            output, in_tok, cached_in_tok, out_tok, reasoning_tok = process_with_gemini(prompt, system_prompt)
-            total_input_tokens = in_tok or 0
-            cached_input_tokens = cached_in_tok or 0
-            regular_input_tokens = total_input_tokens - cached_input_tokens
-            output_tokens = out_tok or 0
-            reasoning_tokens = reasoning_tok or 0
-            
-            # Cost calculation using tiered pricing INCLUDING reasoning tokens
-            regular_input_cost, cached_input_cost, output_cost, reasoning_cost, total_cost = calculate_gemini_tiered_cost_with_reasoning(
-                total_input_tokens, cached_input_tokens, output_tokens, reasoning_tokens
-            )
-            
-            # Display detailed cost breakdown during run
-            total_billable_tokens = total_input_tokens + output_tokens + reasoning_tokens
-            print(f"  ✅ Gemini:")
-            if reasoning_tokens > 0:
-                print(f"     Tokens: {total_billable_tokens} total ({regular_input_tokens} uncached + "
-                      f"{cached_input_tokens} cached + {output_tokens} output + {reasoning_tokens} reasoning)")
-                print(f"     Costs: ${regular_input_cost:.6f} uncached + ${cached_input_cost:.6f} cached + "
-                      f"${output_cost:.6f} output + ${reasoning_cost:.6f} reasoning = ${total_cost:.6f} total")
-            else:
-                print(f"     Tokens: {total_input_tokens} total in ({regular_input_tokens} uncached + "
-                      f"{cached_input_tokens} cached) + {output_tokens} out")
-                print(f"     Costs: ${regular_input_cost:.6f} uncached + ${cached_input_cost:.6f} cached + "
-                      f"${output_cost:.6f} output = ${total_cost:.6f} total")
-            
-            results.append({
-                'Run Number': trial_number,
-                'Vendor': 'Gemini',
-                'Model': get_gemini_model(),
-                'User Prompt': prompt,
-                'System Prompt': system_prompt,
-                'Output': output,
-                'Input Tokens': total_input_tokens,
-                'Cached Input Tokens': cached_input_tokens,
-                'Output Tokens': output_tokens,
-                'Reasoning Tokens': reasoning_tokens,  # Now tracking Gemini reasoning tokens
-                'Input Token Cost (USD)': format_cost(regular_input_cost),
-                'Cached Token Cost (USD)': format_cost(cached_input_cost),
-                'Output Token Cost (USD)': format_cost(output_cost),
-                'Reasoning Token Cost (USD)': format_cost(reasoning_cost),  # Now tracking reasoning cost
-                'Cost (USD)': format_cost(total_cost)
-            })
-        except Exception as e:
-            results.append({
-                'Run Number': trial_number,
-                'Vendor': 'Gemini',
-                'Model': get_gemini_model(),
-                'User Prompt': prompt,
-                'System Prompt': system_prompt,
-                'Output': f"Error: {str(e)}",
-                'Input Tokens': None,
-                'Cached Input Tokens': 0,
-                'Output Tokens': None,
-                'Reasoning Tokens': 0,
-                'Input Token Cost (USD)': None,
-                'Cached Token Cost (USD)': None,
-                'Output Token Cost (USD)': None,
-                'Reasoning Token Cost (USD)': None,
-                'Cost (USD)': None
-            })
-    if 'anthropic' in vendors:
-        try:
-            output, in_tok, cache_creation_tok, cache_read_tok, out_tok = process_with_anthropic(prompt, system_prompt)
-            # Raw token counts from Claude API
-            input_tokens = in_tok or 0
-            cache_creation_tokens = cache_creation_tok or 0
-            cache_read_tokens = cache_read_tok or 0
-            output_tokens = out_tok or 0
-            
-            # Use configured cache type for cost calculation
-            regular_input_cost, cache_creation_cost, cache_read_cost, output_token_cost, cost = calculate_anthropic_cache_cost(
-                input_tokens, cache_creation_tokens, cache_read_tokens, output_tokens
-            )
-            
-            # Display detailed cost breakdown during run
-            total_cached_tokens = cache_creation_tokens + cache_read_tokens
-            regular_input_tokens = max(input_tokens - cache_creation_tokens - cache_read_tokens, 0)
-            print(f"  ✅ Anthropic:")
-            print(f"     Tokens: {input_tokens} total in ({regular_input_tokens} regular + "
-                  f"{cache_creation_tokens} cache-write + {cache_read_tokens} cache-read) + {output_tokens} out")
-            print(f"     Costs: ${regular_input_cost:.6f} regular + ${cache_creation_cost:.6f} cache-write + "
-                  f"${cache_read_cost:.6f} cache-read + ${output_token_cost:.6f} output = ${cost:.6f} total")
-            
-            results.append({
-                'Run Number': trial_number,
-                'Vendor': 'Anthropic',
-                'Model': get_anthropic_model(),
-                'User Prompt': prompt,
-                'System Prompt': system_prompt,
-                'Output': output,
-                'Input Tokens': input_tokens,
-                'Cached Input Tokens': total_cached_tokens,
-                'Output Tokens': output_tokens,
-                'Reasoning Tokens': 0,  # Anthropic doesn't use reasoning tokens
-                'Input Token Cost (USD)': format_cost(regular_input_cost),
-                'Cached Token Cost (USD)': format_cost(cache_creation_cost + cache_read_cost),
-                'Output Token Cost (USD)': format_cost(output_token_cost),
-                'Reasoning Token Cost (USD)': 0.0,  # No reasoning cost for Anthropic
-                'Cost (USD)': format_cost(cost)
-            })
-        except Exception as e:
-            results.append({
-                'Run Number': trial_number,
-                'Vendor': 'Anthropic',
-                'Model': get_anthropic_model(),
-                'User Prompt': prompt,
-                'System Prompt': system_prompt,
-                'Output': f"Error: {str(e)}",
-                'Input Tokens': None,
-                'Cached Input Tokens': 0,
-                'Output Tokens': None,
-                'Reasoning Tokens': 0,
-                'Input Token Cost (USD)': None,
-                'Cached Token Cost (USD)': None,
-                'Output Token Cost (USD)': None,
-                'Reasoning Token Cost (USD)': None,
-                'Cost (USD)': None
-            })
-    if 'grok' in vendors:
-        try:
-            output, in_tok, cached_in_tok, out_tok, reasoning_tok = process_with_grok(prompt, system_prompt)
-            # Raw token counts - no calculations
-            input_tokens = in_tok or 0
-            cached_input_tokens = int(cached_in_tok) if cached_in_tok is not None else 0
-            output_tokens = out_tok or 0
-            reasoning_tokens = reasoning_tok or 0
-            
-            # Use tiered pricing for cost calculation INCLUDING reasoning tokens
-            input_token_cost, cached_token_cost, output_token_cost, reasoning_token_cost, cost = calculate_grok_tiered_cost_with_reasoning(
-                input_tokens, cached_input_tokens, output_tokens, reasoning_tokens
-            )
-            
-            # Display detailed cost breakdown during run
-            uncached_input = max(input_tokens - cached_input_tokens, 0)
-            total_visible_tokens = input_tokens + output_tokens
-            total_billable_tokens = input_tokens + output_tokens + reasoning_tokens
-            print(f"  ✅ Grok:")
-            print(f"     Tokens: {total_billable_tokens} total ({uncached_input} uncached + "
-                  f"{cached_input_tokens} cached + {output_tokens} output + {reasoning_tokens} reasoning)")
-            print(f"     Costs: ${input_token_cost:.6f} uncached + ${cached_token_cost:.6f} cached + "
-                  f"${output_token_cost:.6f} output + ${reasoning_token_cost:.6f} reasoning = ${cost:.6f} total")
-            
-            results.append({
-                'Run Number': trial_number,
-                'Vendor': 'Grok',
-                'Model': get_grok_model(),
-                'User Prompt': prompt,
-                'System Prompt': system_prompt,
-                'Output': output,
-                'Input Tokens': input_tokens,
-                'Cached Input Tokens': cached_input_tokens,
-                'Output Tokens': output_tokens,
-                'Reasoning Tokens': reasoning_tokens,
-                'Input Token Cost (USD)': format_cost(input_token_cost),
-                'Cached Token Cost (USD)': format_cost(cached_token_cost),
-                'Output Token Cost (USD)': format_cost(output_token_cost),
-                'Reasoning Token Cost (USD)': format_cost(reasoning_token_cost),
-                'Cost (USD)': format_cost(cost)
-            })
-        except Exception as e:
-            results.append({
-                'Run Number': trial_number,
-                'Vendor': 'Grok',
-                'Model': get_grok_model(),
-                'User Prompt': prompt,
-                'System Prompt': system_prompt,
-                'Output': f"Error: {str(e)}",
-                'Input Tokens': None,
-                'Cached Input Tokens': 0,
-                'Output Tokens': None,
-                'Reasoning Tokens': 0,
-                'Input Token Cost (USD)': None,
-                'Cached Token Cost (USD)': None,
-                'Output Token Cost (USD)': None,
-                'Reasoning Token Cost (USD)': None,
-                'Cost (USD)': None
-            })
+            results.append(_make_row(
+                trial_number, name, model_fn(), prompt, system_prompt,
+                f"Error: {str(e)}",
+                None, 0, None, 0,
+                None, None, None, None, None,
+                error=True
+            ))
     return results
 
 
-def run_experiments(prompt=None, system_prompt=None, num_trials=None, vendors=None):
+async def _run_trials_batched(prompt, system_prompt, num_trials, vendors, batch_size):
+    """
+    Run the trials in batches of batch_size prompts per API call.
+
+    Each batch issues one call per vendor (concurrently across vendors) and
+    splits the combined completion back into per-trial rows via
+    run_single_trial's precomputed-outcomes path.
+
+    Returns:
+        list: One result-row list per trial, in trial order
+    """
+    vendors = [v.lower() for v in vendors]
+    all_trial_results = []
+    for start in range(1, num_trials + 1, batch_size):
+        trial_numbers = range(start, min(start + batch_size, num_trials + 1))
+        prompts = [prompt] * len(trial_numbers)
+
+        batch_tasks = {
+            vendor: asyncio.create_task(_call_vendor_batch(vendor, prompts, system_prompt))
+            for vendor in vendors if vendor in _ASYNC_CALLS
+        }
+        batch_outcomes = dict(zip(
+            batch_tasks, await asyncio.gather(*batch_tasks.values(), return_exceptions=True)
+        ))
+
+        for index, trial in enumerate(trial_numbers):
+            outcomes = {}
+            for vendor, outcome in batch_outcomes.items():
+                # A failed batch call applies to every trial in the batch
+                outcomes[vendor] = outcome if isinstance(outcome, BaseException) else outcome[index]
+            all_trial_results.append(
+                await run_single_trial(prompt, system_prompt, trial,
+                                       vendors=vendors, outcomes=outcomes)
+            )
+    return all_trial_results
+
+
+def _has_valid_key(vendor):
+    """Whether a vendor's API key is set to something besides a placeholder.
+
+    Reads the key through config's memoized environment snapshot — the
+    same one the clients themselves bind at construction — so validation
+    always agrees with the key a call would actually use; environment
+    changes after the first config access are deliberately not seen. The
+    "your-" prefix test matches the placeholder sentinels the sample .env
+    ships with.
+    """
+    import config
+    key = getattr(config, f"{vendor.upper()}_API_KEY", "")
+    return bool(key) and not key.startswith("your-")
+
+
+# Cost columns zeroed when a trial is replayed from trial 1's memoized
+# results under --dedup-output
+_COST_COLS = (
+    'Input Token Cost (USD)', 'Cached Token Cost (USD)',
+    'Output Token Cost (USD)', 'Reasoning Token Cost (USD)', 'Cost (USD)',
+)
+
+
+def _replay_trial(first_trial_rows, trial_number):
+    """Copy trial 1's result rows for a later trial at zero cost"""
+    rows = []
+    for row in first_trial_rows:
+        replayed = dict(row)
+        replayed['Run Number'] = trial_number
+        for col in _COST_COLS:
+            if replayed[col] is not None:
+                replayed[col] = 0.0
+        rows.append(replayed)
+    return rows
+
+
+async def run_experiments(prompt=None, system_prompt=None, num_trials=None, vendors=None,
+                          batch_size=1, dedup_output=False):
     """
     Run the complete experiment across selected LLM providers.
-    
+
+    Async so each trial's vendor calls can run concurrently; drive it from
+    synchronous code with asyncio.run(run_experiments(...)).
+
     Args:
         prompt (str): User prompt (defaults to config setting)
         system_prompt (str): System prompt (defaults to config setting)
         num_trials (int): Number of trials to run (defaults to config setting)
         vendors (list or None): List of vendors to run (default: all)
-    
+        batch_size (int): Trials to fold into each API call (default 1 =
+            one call per trial per vendor; higher values amortize the
+            system prompt but make per-trial token counts approximate)
+        dedup_output (bool): Call each vendor once and replay trial 1's
+            outputs and token counts for trials 2..N at zero cost. Useful
+            for deterministic tokenization studies; meaningless for
+            variance studies. Ignored in batch mode.
+
     Returns:
         pandas.DataFrame: Results dataframe
     """
@@ -552,29 +850,89 @@ def run_experiments(prompt=None, system_prompt=None, num_trials=None, vendors=No
         num_trials = DEFAULT_NUM_TRIALS
     if vendors is None:
         vendors = ['openai', 'gemini', 'anthropic', 'grok']
+
+    # Drop vendors whose API key is missing up-front instead of sending
+    # every trial's call to a guaranteed auth failure
+    skipped = [v for v in vendors if not _has_valid_key(v)]
+    if skipped:
+        vendors = [v for v in vendors if v not in skipped]
+        print(f"Skipping vendors without a valid API key: "
+              f"{', '.join(v.capitalize() for v in skipped)}")
+    if not vendors:
+        print("No selected vendor has a valid API key; set the *_API_KEY "
+              "environment variables and re-run.")
+        return ResultBuffer().to_dataframe()
+
     print(f"Starting token counter experiment:")
     print(f"  User prompt: '{prompt}'")
     print(f"  System prompt: '{system_prompt}'")
     print(f"  Number of trials: {num_trials}")
     print(f"  Testing: {', '.join([v.capitalize() for v in vendors])}")
+    _warn_below_cache_minimum(prompt, system_prompt, vendors)
     print()
     
-    all_results = []
-    
-    # Run trials with cost tracking
+    results = ResultBuffer()
+
+    try:
+        # Warm each vendor's connection pool before the timed trials begin
+        await prewarm_clients(vendors)
+
+        if batch_size > 1:
+            # Batch mode: fold several trials' prompts into each API call
+            print(f"Running {num_trials} trial(s) in batches of {batch_size}...")
+            all_trial_results = await _run_trials_batched(
+                prompt, system_prompt, num_trials, vendors, batch_size
+            )
+        elif dedup_output and num_trials > 1:
+            # Dedup mode: every trial sends the identical prompt pair, so
+            # call each vendor once and replay the memoized results for the
+            # remaining trials at zero cost
+            print(f"Running 1 live trial; replaying it for trials 2-{num_trials} (--dedup-output)...")
+            first_trial = await run_single_trial(prompt, system_prompt, 1, vendors=vendors)
+            all_trial_results = [first_trial] + [
+                _replay_trial(first_trial, trial) for trial in range(2, num_trials + 1)
+            ]
+        else:
+            # Launch every trial concurrently; the per-vendor semaphores in
+            # run_single_trial bound how many requests are in flight per provider,
+            # so total runtime approaches one trial's latency instead of N trials'.
+            # Per-vendor API errors are absorbed inside run_single_trial as
+            # error rows, so a task only raises on a genuinely fatal bug — and
+            # the TaskGroup then cancels the remaining trials promptly instead
+            # of letting them run on over a doomed experiment.
+            print(f"Running {num_trials} trial(s) concurrently...")
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(
+                            run_single_trial(prompt, system_prompt, trial, vendors=vendors))
+                         for trial in range(1, num_trials + 1)]
+            # Task order matches submission order, so results stay in trial order
+            all_trial_results = [task.result() for task in tasks]
+    finally:
+        # Close the shared HTTP pool while the event loop is still alive so
+        # pooled connections shut down cleanly instead of leaking at exit
+        await aclose_shared_async_client()
+
+    # Track costs per trial
     trial_costs = []
-    for trial in range(1, num_trials + 1):
-        print(f"Running trial {trial}/{num_trials}...")
-        trial_results = run_single_trial(prompt, system_prompt, trial, vendors=vendors)
-        all_results.extend(trial_results)
-        
-        # Track costs for this trial
+    for trial, trial_results in enumerate(all_trial_results, 1):
+        results.extend(trial_results)
         trial_cost = sum([r['Cost (USD)'] for r in trial_results if r['Cost (USD)'] is not None])
         trial_costs.append(trial_cost)
         print(f"  Trial {trial} total cost: ${trial_cost:.6f}")
-    
-    # Create DataFrame
-    df = pd.DataFrame(all_results, columns=CSV_COLUMNS)
+
+    # Create DataFrame from the columnar buffer in one shot; the running
+    # token stats ride along in attrs so display_summary can print them
+    # without re-scanning the frame
+    df = results.to_dataframe()
+    df.attrs['token_stats'] = results.token_stats()
+    # Rows land in trial order, so the first len(vendors) rows are always
+    # trial 1; display_summary uses this to slice the sample block
+    # positionally instead of scanning Run Number
+    df.attrs['vendors_per_trial'] = len(vendors)
+    # These columns repeat a handful of distinct strings across all N×4 rows;
+    # categorical dtype stores each string once plus small integer codes
+    for column in ('Vendor', 'Model', 'User Prompt', 'System Prompt'):
+        df[column] = df[column].astype('category')
     
     # Display experiment cost summary
     total_cost = sum(trial_costs)
@@ -600,20 +958,64 @@ def save_results_to_csv(df, output_path=None):
     """
     if output_path is None:
         output_path = CSV_OUTPUT_PATH
-    
+
     # Prevent scientific notation in cost columns
-    cost_columns = ['Input Token Cost (USD)', 'Cached Token Cost (USD)', 
-                   'Output Token Cost (USD)', 'Reasoning Token Cost (USD)', 'Cost (USD)']
-    
-    # Format cost columns to avoid scientific notation
-    df_formatted = df.copy()
-    for col in cost_columns:
-        if col in df_formatted.columns:
-            df_formatted[col] = df_formatted[col].apply(
-                lambda x: f"{x:.8f}" if x is not None and isinstance(x, (int, float)) else x
-            )
-    
-    df_formatted.to_csv(output_path, index=False, encoding='utf-8')
+    cost_columns = {'Input Token Cost (USD)', 'Cached Token Cost (USD)',
+                    'Output Token Cost (USD)', 'Reasoning Token Cost (USD)', 'Cost (USD)'}
+
+    def _cell(value, is_cost):
+        """Format one cell: fixed-point for costs, blank for missing values"""
+        if pd.isna(value):
+            return ''
+        if is_cost and isinstance(value, (int, float)):
+            return f"{value:.8f}"
+        return value
+
+    # Stream rows straight to disk with csv.writer instead of materializing
+    # a formatted copy of the whole frame for to_csv; peak memory on the
+    # save path stays at one row regardless of trial count
+    is_cost_column = [col in cost_columns for col in df.columns]
+    # A 1 MiB write buffer batches the row writes into a few large syscalls
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(df.columns)
+        for row in df.itertuples(index=False, name=None):
+            writer.writerow([
+                _cell(value, is_cost) for value, is_cost in zip(row, is_cost_column)
+            ])
+    print(f"Raw data saved to {output_path}")
+
+
+def save_results_to_jsonl(df, output_path):
+    """
+    Save results as JSON Lines, one record per row.
+
+    JSONL sidesteps CSV's per-cell quoting state machine, which dominates
+    write time when model outputs contain commas, quotes, and newlines
+    (they usually do). Rows are streamed to a binary handle one at a time
+    with the fastest available encoder, so peak memory stays at one row.
+
+    Args:
+        df (pandas.DataFrame): Results dataframe
+        output_path (str): Output file path
+    """
+    try:
+        import orjson
+
+        def _line(row):
+            return orjson.dumps(row, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    except ImportError:
+        import json
+
+        def _line(row):
+            return (json.dumps(row, default=str) + "\n").encode('utf-8')
+
+    columns = list(df.columns)
+    with open(output_path, 'wb') as f:
+        for values in df.itertuples(index=False, name=None):
+            row = {col: (None if pd.isna(value) else value)
+                   for col, value in zip(columns, values)}
+            f.write(_line(row))
     print(f"Raw data saved to {output_path}")
 
 
@@ -621,115 +1023,181 @@ def save_experiment_summary(df, summary_path):
     """
     Save the experiment summary (as printed) to a text file.
     """
-    from io import StringIO
-    import sys
-    # Capture the printed summary
-    old_stdout = sys.stdout
-    sys.stdout = mystdout = StringIO()
-    display_summary(df)
-    sys.stdout = old_stdout
+    # Write straight to the file instead of redirecting sys.stdout into a
+    # StringIO: no process-global mutation, and no second in-memory copy
+    # of the whole summary
     with open(summary_path, 'w', encoding='utf-8') as f:
-        f.write(mystdout.getvalue())
+        display_summary(df, file=f)
     print(f"Experiment summary saved to {summary_path}")
 
 
-def display_summary(df, log_failed_path=None):
+def display_summary(df, log_failed_path=None, file=None):
     """
     Display a summary of the results, including failed call breakdown by vendor.
     Optionally log failed calls to a file for troubleshooting.
     Args:
         df (pandas.DataFrame): Results dataframe
         log_failed_path (str): Path to log file for failed calls (optional)
+        file: Writable text stream for the summary (default: stdout)
     """
-    print("\n" + "="*50)
-    print("EXPERIMENT SUMMARY")
-    print("="*50)
+    def _print(*args):
+        print(*args, file=file)
+
+    _print("\n" + "="*50)
+    _print("EXPERIMENT SUMMARY")
+    _print("="*50)
     
-    # Basic stats
+    # Basic stats; rows are tagged with a boolean Error flag at creation
+    # time, so failure detection is a plain mask instead of re-scanning
+    # every (potentially long) output string
+    failed_mask = df['Error'].astype(bool)
     total_calls = len(df)
-    successful_calls = len(df[~df['Output'].str.startswith('Error:', na=False)])
-    failed_calls = total_calls - successful_calls
-    
-    print(f"Total API calls: {total_calls}")
-    print(f"Successful calls: {successful_calls}")
-    print(f"Failed calls: {failed_calls}")
-    
-    # Failed calls by vendor
-    failed = df[df['Output'].str.startswith('Error:', na=False)]
-    if not failed.empty:
-        print("\nFailed calls by vendor:")
+    failed_calls = int(failed_mask.sum())
+    successful_calls = total_calls - failed_calls
+
+    _print(f"Total API calls: {total_calls}")
+    _print(f"Successful calls: {successful_calls}")
+    _print(f"Failed calls: {failed_calls}")
+
+    # Failed calls by vendor; the failed frame is only materialized when
+    # there is something to report — the counters above already came from
+    # the mask alone
+    if failed_calls:
+        failed = df[failed_mask]
+        _print("\nFailed calls by vendor:")
+        # value_counts on the categorical Vendor column reports every
+        # category; keep only vendors that actually failed
         failed_counts = failed['Vendor'].value_counts()
-        for vendor, count in failed_counts.items():
-            print(f"  {vendor}: {count}")
-        # Log failed calls to file if requested
+        for vendor, count in failed_counts[failed_counts > 0].items():
+            _print(f"  {vendor}: {count}")
+        # Log failed calls to file if requested; sort once and walk plain
+        # numpy arrays instead of iterrows, which boxes every row into a
+        # Series
         if log_failed_path:
+            failed_sorted = failed.sort_values(['Vendor', 'Run Number'])
+            vendors_arr = failed_sorted['Vendor'].to_numpy()
+            runs_arr = failed_sorted['Run Number'].to_numpy()
+            outputs_arr = failed_sorted['Output'].to_numpy()
+            lines = ["Failed API Calls by Vendor\n"]
+            previous_vendor = None
+            for vendor, run, output in zip(vendors_arr, runs_arr, outputs_arr):
+                if vendor != previous_vendor:
+                    lines.append(f"\nVendor: {vendor}\n")
+                    previous_vendor = vendor
+                lines.append(f"  Run {run}: {output}\n")
             with open(log_failed_path, 'w', encoding='utf-8') as f:
-                f.write("Failed API Calls by Vendor\n")
-                for vendor in failed['Vendor'].unique():
-                    f.write(f"\nVendor: {vendor}\n")
-                    vendor_failed = failed[failed['Vendor'] == vendor]
-                    for _, row in vendor_failed.iterrows():
-                        f.write(f"  Run {row['Run Number']}: {row['Output']}\n")
-            print(f"\nDetailed failed call log written to: {log_failed_path}")
+                f.write("".join(lines))
+            _print(f"\nDetailed failed call log written to: {log_failed_path}")
     else:
-        print("\nNo failed calls by vendor.")
+        _print("\nNo failed calls by vendor.")
     
-    # Enhanced cost analysis
-    successful_df = df[~df['Output'].str.startswith('Error:', na=False)]
-    if not successful_df.empty:
-        print("\n" + "="*50)
-        print("COST ANALYSIS")
-        print("="*50)
+    # Enhanced cost analysis; skip the frame copy entirely when every
+    # call failed
+    successful_df = df[~failed_mask] if successful_calls else df.iloc[0:0]
+    if successful_calls:
+        _print("\n" + "="*50)
+        _print("COST ANALYSIS")
+        _print("="*50)
         
+        # One grouped aggregation feeds the cost summary, the efficiency
+        # figures, and the ranking — a single hash partition of the Vendor
+        # column instead of three
+        stats = successful_df.groupby('Vendor', observed=True).agg(
+            runs=('Cost (USD)', 'count'),
+            avg_cost=('Cost (USD)', 'mean'),
+            total_cost=('Cost (USD)', 'sum'),
+            min_cost=('Cost (USD)', 'min'),
+            max_cost=('Cost (USD)', 'max'),
+            std_cost=('Cost (USD)', 'std'),
+            total_out_tokens=('Output Tokens', 'sum'),
+        )
+
         # Cost summary by vendor
-        cost_summary = successful_df.groupby('Vendor').agg({
-            'Cost (USD)': ['count', 'mean', 'sum', 'min', 'max', 'std']
-        }).round(6)
+        cost_summary = stats.iloc[:, :6].round(6)
         cost_summary.columns = ['Runs', 'Avg Cost', 'Total Cost', 'Min Cost', 'Max Cost', 'Std Dev']
-        print("\nCost summary by vendor:")
-        print(cost_summary)
-        
+        _print("\nCost summary by vendor:")
+        _print(cost_summary)
+
         # Cost efficiency (output tokens per dollar)
-        print("\nCost efficiency (output tokens per dollar):")
-        efficiency = successful_df.groupby('Vendor', include_groups=False).apply(
-            lambda x: x['Output Tokens'].sum() / x['Cost (USD)'].sum() if x['Cost (USD)'].sum() > 0 else 0
-        ).round(0)
+        _print("\nCost efficiency (output tokens per dollar):")
+        efficiency = (
+            stats['total_out_tokens'] / stats['total_cost'].where(stats['total_cost'] > 0)
+        ).fillna(0).round(0)
         for vendor, eff in efficiency.sort_values(ascending=False).items():
-            print(f"  {vendor}: {eff:,.0f} tokens/$")
-        
+            _print(f"  {vendor}: {eff:,.0f} tokens/$")
+
         # Individual run costs for comparison
-        print("\nIndividual run costs by vendor:")
+        _print("\nIndividual run costs by vendor:")
         for vendor in successful_df['Vendor'].unique():
             vendor_data = successful_df[successful_df['Vendor'] == vendor]['Cost (USD)']
             costs_str = ', '.join([f"${cost:.6f}" for cost in vendor_data])
-            print(f"  {vendor}: {costs_str}")
-        
+            _print(f"  {vendor}: {costs_str}")
+
         # Cost ranking
-        total_costs = successful_df.groupby('Vendor')['Cost (USD)'].sum().sort_values()
-        print(f"\nCost ranking (total experiment cost):")
-        for i, (vendor, cost) in enumerate(total_costs.items(), 1):
-            print(f"  {i}. {vendor}: ${cost:.6f}")
+        _print(f"\nCost ranking (total experiment cost):")
+        for i, (vendor, cost) in enumerate(stats['total_cost'].sort_values().items(), 1):
+            _print(f"  {i}. {vendor}: ${cost:.6f}")
     
     # Token usage summary
-    print("\n" + "="*50)
-    print("TOKEN USAGE SUMMARY")
-    print("="*50)
+    _print("\n" + "="*50)
+    _print("TOKEN USAGE SUMMARY")
+    _print("="*50)
     
-    if not successful_df.empty:
-        token_summary = successful_df.groupby('Vendor').agg({
+    # Prefer the running stats accumulated while rows were produced (O(1)
+    # here); fall back to a groupby scan for frames built elsewhere
+    token_stats = df.attrs.get('token_stats')
+    if token_stats:
+        header = f"{'':12}" + "".join(f"{col + ' (mean/sum)':>32}" for col in ResultBuffer._TOKEN_COLS)
+        _print(header)
+        for vendor, cols in token_stats.items():
+            cells = "".join(
+                f"{round(mean, 1):>24}/{total}" for _, mean, total in
+                (cols[col] for col in ResultBuffer._TOKEN_COLS)
+            )
+            _print(f"{vendor:12}{cells}")
+
+        # Provider-side prompt-cache hit rate: identical prefixes across
+        # trials should be billed at the cached rate, so a low rate here
+        # means the repeated system prompt isn't being cached as intended
+        _print("\nPrompt-cache hit rate (cached / input tokens):")
+        for vendor, cols in token_stats.items():
+            cached = cols['Cached Input Tokens'][2]
+            total = cols['Input Tokens'][2]
+            rate = (cached / total * 100) if total else 0.0
+            _print(f"  {vendor}: {rate:.1f}%")
+    elif not successful_df.empty:
+        token_summary = successful_df.groupby('Vendor', observed=True).agg({
             'Input Tokens': ['mean', 'sum'],
             'Cached Input Tokens': ['mean', 'sum'],
             'Output Tokens': ['mean', 'sum']
         }).round(1)
-        print(token_summary)
+        _print(token_summary)
+
+        # Provider-side prompt-cache hit rate: identical prefixes across
+        # trials should be billed at the cached rate, so a low rate here
+        # means the repeated system prompt isn't being cached as intended
+        totals = successful_df.groupby('Vendor', observed=True)[['Cached Input Tokens', 'Input Tokens']].sum()
+        _print("\nPrompt-cache hit rate (cached / input tokens):")
+        for vendor, (cached, total) in totals.iterrows():
+            rate = (cached / total * 100) if total else 0.0
+            _print(f"  {vendor}: {rate:.1f}%")
     
-    # Sample outputs
-    print("\nSample outputs (first trial):")
-    first_trial = df[df['Run Number'] == 1]
-    for _, row in first_trial.iterrows():
-        output_preview = row['Output'][:100] + "..." if len(str(row['Output'])) > 100 else row['Output']
-        cost_info = f" (${row['Cost (USD)']:.6f})" if pd.notna(row['Cost (USD)']) else " (failed)"
-        print(f"  {row['Vendor']}: {output_preview}{cost_info}")
+    # Sample outputs; the truncation runs as one vectorized pass instead of
+    # per-row Python slicing through iterrows. First-trial rows always sit
+    # at the head of the frame, so a positional slice avoids scanning the
+    # whole Run Number column when the row count is known
+    _print("\nSample outputs (first trial):")
+    vendors_per_trial = df.attrs.get('vendors_per_trial')
+    if vendors_per_trial:
+        first_trial = df.iloc[:vendors_per_trial]
+    else:
+        first_trial = df[df['Run Number'] == 1]
+    outputs = first_trial['Output'].astype(str)
+    previews = outputs.str.slice(0, 100).where(outputs.str.len() <= 100,
+                                               outputs.str.slice(0, 100) + "...")
+    for vendor, preview, cost in zip(first_trial['Vendor'], previews, first_trial['Cost (USD)']):
+        cost_info = f" (${cost:.6f})" if pd.notna(cost) else " (failed)"
+        _print(f"  {vendor}: {preview}{cost_info}")
 
 
 def main():
@@ -779,7 +1247,67 @@ Examples:
     )
     
     parser.add_argument(
-        '--enhanced', 
+        '--batch-size', '-b',
+        type=int,
+        default=1,
+        help='Trials to fold into a single API call per vendor (default: 1, '
+             'no batching). Higher values cut round trips and amortize the '
+             'system prompt, but per-trial token counts become approximate.'
+    )
+
+    parser.add_argument(
+        '--format', '-f',
+        choices=('csv', 'jsonl'),
+        default='csv',
+        help='Raw results format (default: csv). jsonl streams one JSON '
+             'record per row and avoids CSV quoting overhead on long outputs.'
+    )
+
+    parser.add_argument(
+        '--offline',
+        action='store_true',
+        help='Estimate input token counts locally and exit without calling '
+             'any APIs (exact via tiktoken when installed, ~4 chars/token '
+             'otherwise)'
+    )
+
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Replay identical (model, system, prompt) calls from the on-disk '
+             'response cache (.llm_cache/) instead of hitting the APIs. Off by '
+             'default so runs measure live provider behavior; equivalent to '
+             'setting LLM_CACHE=1.'
+    )
+
+    parser.add_argument(
+        '--dedup-output',
+        action='store_true',
+        help='Call each vendor once and replay trial 1\'s output and token '
+             'counts for the remaining trials at zero cost. Deterministic '
+             'baseline for tokenization studies; defeats variance studies. '
+             'Ignored with --batch-size > 1.'
+    )
+
+    parser.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=None,
+        help='Maximum in-flight requests per vendor across concurrent '
+             'trials (default: 8). Raise it when your rate limits allow, '
+             'lower it if you see 429s despite the retry backoff.'
+    )
+
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Suppress the per-call token/cost breakdowns during the run; '
+             'the summary and saved results are unaffected. Speeds up large '
+             '--trials runs on slow terminals.'
+    )
+
+    parser.add_argument(
+        '--enhanced',
         action='store_true',
         help='Use enhanced features (rate limiting, retry logic, advanced analytics)'
     )
@@ -791,7 +1319,39 @@ Examples:
     )
     
     args = parser.parse_args()
-    
+
+    if args.quiet:
+        global _QUIET
+        _QUIET = True
+
+    # Per-vendor semaphores are created lazily from this module constant,
+    # so overriding it before any event loop starts covers the whole run
+    if args.max_concurrency is not None:
+        if args.max_concurrency < 1:
+            parser.error("--max-concurrency must be at least 1")
+        dispatcher.MAX_CONCURRENT_PER_VENDOR = args.max_concurrency
+
+    # The clients read LLM_CACHE at call time, so flipping the environment
+    # here covers both the plain and enhanced code paths
+    if args.cache:
+        os.environ['LLM_CACHE'] = '1'
+
+    # Offline mode: answer the token-count question locally, for free
+    if args.offline:
+        from local_token_counter import count_message_tokens, is_exact
+
+        user_prompt = args.prompt if args.prompt is not None else DEFAULT_USER_PROMPT
+        system_prompt = args.system if args.system is not None else DEFAULT_SYSTEM_PROMPT
+
+        print("Offline input token counts (no API calls):")
+        for vendor, model in MODELS.items():
+            count = count_message_tokens(user_prompt, system_prompt, model)
+            # tiktoken is OpenAI's tokenizer; other vendors' counts are
+            # estimates either way
+            kind = "exact" if vendor == 'openai' and is_exact(model) else "estimated"
+            print(f"  {vendor.capitalize():12} {model}: ~{count} input tokens ({kind})")
+        return 0
+
     # Handle enhanced features
     if args.enhanced or args.validate_only:
         try:
@@ -804,7 +1364,6 @@ Examples:
                 # Use enhanced features with the main runner
                 from utils.rate_limiter import RateLimiter
                 from utils.retry import retry_with_backoff
-                from pathlib import Path
                 Path("outputs").mkdir(exist_ok=True)
                 
                 # Enhanced mode uses the same runner but with additional features
@@ -816,15 +1375,20 @@ Examples:
                 
                 print("Enhanced features: rate limiting, retry logic, advanced analytics enabled")
                 
-                df = run_experiments(
+                df = asyncio.run(run_experiments(
                     prompt=user_prompt,
                     system_prompt=system_prompt,
                     num_trials=args.trials,
-                    vendors=vendors
-                )
-                
+                    vendors=vendors,
+                    batch_size=args.batch_size,
+                    dedup_output=args.dedup_output
+                ))
+
                 if not df.empty:
-                    save_results_to_csv(df, output_file)
+                    if args.format == 'jsonl':
+                        save_results_to_jsonl(df, output_file)
+                    else:
+                        save_results_to_csv(df, output_file)
                     
                     # Generate enhanced analytics
                     try:
@@ -850,12 +1414,15 @@ Examples:
     system_prompt = args.system if args.system is not None else DEFAULT_SYSTEM_PROMPT
     
     # Generate timestamped filename in outputs/ if no output specified
-    output_file = (args.output if args.output is not None 
-                   else get_timestamped_filename(base_name="api_raw"))
-    # Also generate a log file for failed calls
-    log_failed_path = output_file.replace('.csv', '_failed.log')
-    # Generate summary file name
-    summary_file = output_file.replace('api_raw', 'experiment_summary').replace('.csv', '.txt')
+    output_file = (args.output if args.output is not None
+                   else get_timestamped_filename(base_name="api_raw", extension=args.format))
+    # Derive the failed-call log and summary names from whatever the raw
+    # results extension is (.csv or .jsonl); renaming only the final stem
+    # keeps an 'api_raw' appearing in a parent directory untouched
+    output_path = Path(output_file)
+    log_failed_path = str(output_path.with_name(output_path.stem + '_failed.log'))
+    summary_file = str(output_path.with_name(
+        output_path.stem.replace('api_raw', 'experiment_summary') + '.txt'))
     
     # Parse vendors argument
     vendors = [v.strip().lower() for v in args.vendors.split(',')] if args.vendors else None
@@ -869,14 +1436,19 @@ Examples:
 
     try:
         # Run the experiment
-        df = run_experiments(
+        df = asyncio.run(run_experiments(
             prompt=user_prompt,
             system_prompt=system_prompt,
             num_trials=args.trials,
-            vendors=vendors
-        )
+            vendors=vendors,
+            batch_size=args.batch_size,
+            dedup_output=args.dedup_output
+        ))
         # Save raw results
-        save_results_to_csv(df, output_file)
+        if args.format == 'jsonl':
+            save_results_to_jsonl(df, output_file)
+        else:
+            save_results_to_csv(df, output_file)
         # Save experiment summary to a separate file
         save_experiment_summary(df, summary_file)
         # Display summary and log failed calls
@@ -3,6 +3,7 @@ Test suite for client implementations.
 """
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
@@ -43,6 +44,110 @@ class TestBaseLLMClient:
         assert response.model == "test-model"
 
 
+class _StubClient(BaseLLMClient):
+    """Concrete client returning a canned provider tuple, no network"""
+
+    def __init__(self):
+        super().__init__('openai')  # reuse a real pricing record
+        self.api_calls = 0
+
+    def _make_api_call(self, prompt, system_prompt="", model=None):
+        self.api_calls += 1
+        # OpenAI-protocol shape: the fifth field is reasoning tokens
+        return ("stub output", 1000, 200, 500, 30)
+
+    def get_model_name(self):
+        return "stub-model"
+
+
+class TestProcessContract:
+    """process()/process_async() must accept the providers' 5-field tuples"""
+
+    def _check(self, response, client):
+        assert response.output == "stub output"
+        assert response.usage == TokenUsage(1000, 200, 500)
+        assert response.cost == client.calculate_cost(response.usage)
+
+    def test_process_unpacks_provider_tuple(self):
+        client = _StubClient()
+        self._check(client.process("p"), client)
+
+    def test_process_async_unpacks_provider_tuple(self):
+        import asyncio
+        client = _StubClient()
+        self._check(asyncio.run(client.process_async("p")), client)
+
+    def test_anthropic_normalization_folds_cache_split(self):
+        """Anthropic's cache write/read split folds into one cached count"""
+        result = ("out", 1000, 150, 50, 500)
+        normalized = AnthropicClient._normalize_result(object(), result)
+        assert normalized == ("out", 1000, 200, 500)
+
+    def test_process_batch_splits_numbered_answers(self):
+        """One marshaled call fans back out into per-prompt responses"""
+        client = _StubClient()
+        client._make_api_call = lambda prompt, system_prompt="", model=None: (
+            "ANSWER 1: alpha\nANSWER 2: beta", 1000, 200, 500, 30)
+
+        responses = client.process_batch(["q1", "q2"])
+
+        assert [r.output for r in responses] == ["alpha", "beta"]
+        # Usage and cost are split evenly across the batch
+        assert responses[0].usage == TokenUsage(500, 100, 250)
+        whole_call_cost = client.calculate_cost(TokenUsage(1000, 200, 500))
+        assert responses[0].cost == round(whole_call_cost / 2, 6)
+
+
+class TestResponseCache:
+    """The on-disk cache serves repeat calls on the dispatch path"""
+
+    def test_dispatch_serves_cached_result(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv('LLM_CACHE', '1')
+        client = _StubClient()
+
+        first = client._dispatch_api_call("p", "s")
+        second = client._dispatch_api_call("p", "s")
+
+        assert client.api_calls == 1
+        assert tuple(second) == tuple(first)
+
+    def test_dispatch_async_serves_cached_result(self, tmp_path, monkeypatch):
+        import asyncio
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv('LLM_CACHE', '1')
+        client = _StubClient()
+
+        async def twice():
+            first = await client._dispatch_api_call_async("p", "s")
+            second = await client._dispatch_api_call_async("p", "s")
+            return first, second
+
+        first, second = asyncio.run(twice())
+        assert client.api_calls == 1
+        assert tuple(second) == tuple(first)
+
+
+class TestDispatcher:
+    """Concurrent fan-out returns real responses from working clients"""
+
+    def test_run_all_vendors_with_stub(self, monkeypatch):
+        import asyncio
+        from clients import dispatcher
+
+        stub = _StubClient()
+        monkeypatch.setattr(dispatcher.ClientFactory, 'get_client',
+                            staticmethod(lambda vendor: stub))
+
+        results = asyncio.run(dispatcher.run_all_vendors("p", vendors=['openai', 'grok']))
+
+        assert set(results) == {'openai', 'grok'}
+        for response in results.values():
+            assert response.output == "stub output"
+            assert response.usage == TokenUsage(1000, 200, 500)
+        assert stub.api_calls == 2
+
+
 class TestClientFactory:
     """Test the client factory"""
     
@@ -74,53 +179,43 @@ class TestClientFactory:
         assert set(valid) == {'openai', 'gemini'}
 
 
+# Per-million rates the mock client used by TestCostCalculations carries
+INPUT_RATE = 2.0
+CACHED_RATE = 0.5
+OUTPUT_RATE = 8.0
+
+
+@pytest.fixture(scope="module")
+def rate_client():
+    """Plain stub carrying the per-token rates calculate_cost reads"""
+    return SimpleNamespace(
+        provider_name='test',
+        _input_rate=INPUT_RATE / 1_000_000,
+        _cached_rate=CACHED_RATE / 1_000_000,
+        _output_rate=OUTPUT_RATE / 1_000_000,
+    )
+
+
 class TestCostCalculations:
     """Test cost calculation accuracy"""
-    
-    @patch('config.MODELS_INFO')
-    def test_cost_calculation_no_cache(self, mock_models_info):
-        """Test cost calculation without caching"""
-        mock_models_info.__getitem__.return_value = {
-            'input_cost_per_million': 2.0,
-            'cached_input_cost_per_million': 0.5,
-            'output_cost_per_million': 8.0
-        }
-        
-        # Mock client
-        client = Mock(spec=BaseLLMClient)
-        client.provider_name = 'test'
-        client.get_model_info.return_value = mock_models_info['test']
-        
-        # Test calculation
-        usage = TokenUsage(input_tokens=1000, cached_input_tokens=0, output_tokens=500)
-        expected_cost = (1000 * 2.0 + 0 * 0.5 + 500 * 8.0) / 1_000_000
-        
-        # Use the actual calculation method
-        from clients.base_client import BaseLLMClient
-        actual_cost = BaseLLMClient.calculate_cost(client, usage)
-        
-        assert abs(actual_cost - expected_cost) < 1e-10
-    
-    @patch('config.MODELS_INFO')
-    def test_cost_calculation_with_cache(self, mock_models_info):
-        """Test cost calculation with caching"""
-        mock_models_info.__getitem__.return_value = {
-            'input_cost_per_million': 2.0,
-            'cached_input_cost_per_million': 0.5,
-            'output_cost_per_million': 8.0
-        }
-        
-        client = Mock(spec=BaseLLMClient)
-        client.provider_name = 'test'
-        client.get_model_info.return_value = mock_models_info['test']
-        
-        usage = TokenUsage(input_tokens=1000, cached_input_tokens=200, output_tokens=500)
-        # Uncached: 800, Cached: 200, Output: 500
-        expected_cost = (800 * 2.0 + 200 * 0.5 + 500 * 8.0) / 1_000_000
-        
-        from clients.base_client import BaseLLMClient
-        actual_cost = BaseLLMClient.calculate_cost(client, usage)
-        
+
+    @pytest.mark.parametrize(
+        ("input_tokens", "cached_tokens", "output_tokens"),
+        [(1000, 0, 500), (1000, 200, 500)],
+        ids=["no_cache", "with_cache"],
+    )
+    def test_cost_calculation(self, rate_client, input_tokens, cached_tokens, output_tokens):
+        """Uncached input, cached input, and output are billed at their own rates"""
+        usage = TokenUsage(input_tokens=input_tokens,
+                           cached_input_tokens=cached_tokens,
+                           output_tokens=output_tokens)
+        uncached = input_tokens - cached_tokens
+        expected_cost = (uncached * INPUT_RATE
+                         + cached_tokens * CACHED_RATE
+                         + output_tokens * OUTPUT_RATE) / 1_000_000
+
+        actual_cost = BaseLLMClient.calculate_cost(rate_client, usage)
+
         assert abs(actual_cost - expected_cost) < 1e-10
 
 
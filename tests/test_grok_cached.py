@@ -1,54 +1,86 @@
 """
-Focused validation script for Grok cached token extraction only.
+Focused validation for Grok cached token extraction.
+
+The extraction logic itself is tested locally against stub completions;
+the live API round-trip only runs when a real GROK_API_KEY is configured,
+so CI and keyless dev runs neither spend money nor hit the network.
 """
 
-from clients.grok_client import process_with_grok
-from openai import OpenAI
+from types import SimpleNamespace
+
+import pytest
+
+from clients.grok_client import extract_cached_tokens
 from config import GROK_API_KEY, MODELS_INFO, GROK_BASE_URL
 
+
+def _completion_with_details(cached_tokens):
+    """Build a completion-shaped stub with prompt_tokens_details"""
+    return SimpleNamespace(
+        usage=SimpleNamespace(
+            prompt_tokens=12,
+            completion_tokens=5,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=cached_tokens),
+        )
+    )
+
+
+def test_extract_cached_tokens_present():
+    """A populated cached_tokens field is returned as-is"""
+    assert extract_cached_tokens(_completion_with_details(7)) == 7
+
+
+def test_extract_cached_tokens_none():
+    """A None cached_tokens field normalizes to 0"""
+    assert extract_cached_tokens(_completion_with_details(None)) == 0
+
+
+def test_extract_cached_tokens_missing_details():
+    """Responses without prompt_tokens_details normalize to 0"""
+    completion = SimpleNamespace(
+        usage=SimpleNamespace(prompt_tokens=12, completion_tokens=5)
+    )
+    assert extract_cached_tokens(completion) == 0
+    # Details object present but None behaves the same
+    completion.usage.prompt_tokens_details = None
+    assert extract_cached_tokens(completion) == 0
+
+
 def test_grok_cached_extraction():
-    """Test just the cached token extraction logic using the same API response."""
-    
+    """Test the cached token extraction logic against a live API response."""
+    if not GROK_API_KEY or GROK_API_KEY.startswith("your-"):
+        pytest.skip("GROK_API_KEY not set")
+
     print("=== TESTING GROK CACHED TOKEN EXTRACTION LOGIC ===")
-    
+
     # Make one API call
+    from openai import OpenAI
     client = OpenAI(api_key=GROK_API_KEY, base_url=GROK_BASE_URL)
     completion = client.chat.completions.create(
         model=MODELS_INFO["grok"]["model"],
         messages=[{"role": "user", "content": "Test prompt for caching"}]
     )
-    
+
     print("API Response Structure:")
     print(f"  prompt_tokens: {completion.usage.prompt_tokens}")
     print(f"  completion_tokens: {completion.usage.completion_tokens}")
     print(f"  prompt_tokens_details exists: {hasattr(completion.usage, 'prompt_tokens_details')}")
-    
-    if hasattr(completion.usage, 'prompt_tokens_details') and completion.usage.prompt_tokens_details:
-        ptd = completion.usage.prompt_tokens_details
-        print(f"  prompt_tokens_details.cached_tokens: {getattr(ptd, 'cached_tokens', 'NOT_FOUND')}")
-        
-        # Test our extraction logic exactly as implemented in grok_client.py
-        cached_tokens_extracted = 0
-        if (hasattr(completion, 'usage') and completion.usage and 
-            hasattr(completion.usage, 'prompt_tokens_details') and 
-            completion.usage.prompt_tokens_details):
-            cached_tokens_extracted = getattr(completion.usage.prompt_tokens_details, 'cached_tokens', 0) or 0
-            
-        print(f"  Our extraction result: {cached_tokens_extracted}")
-        
+
+    cached_tokens_extracted = extract_cached_tokens(completion)
+    print(f"  Our extraction result: {cached_tokens_extracted}")
+
+    ptd = getattr(completion.usage, 'prompt_tokens_details', None)
+    if ptd:
         # Direct access
         direct_access = ptd.cached_tokens if ptd.cached_tokens is not None else 0
         print(f"  Direct access result: {direct_access}")
-        
-        print(f"  EXTRACTION MATCHES: {cached_tokens_extracted == direct_access}")
-        
-        if cached_tokens_extracted == direct_access:
-            print("\n✅ GROK CACHED TOKEN EXTRACTION IS 100% ACCURATE!")
-        else:
-            print("\n❌ GROK CACHED TOKEN EXTRACTION HAS ISSUES!")
+
+        assert cached_tokens_extracted == direct_access
+        print("\n✅ GROK CACHED TOKEN EXTRACTION IS 100% ACCURATE!")
     else:
-        print("  No prompt_tokens_details found")
+        assert cached_tokens_extracted == 0
         print("\n✅ GROK CACHED TOKEN EXTRACTION HANDLES MISSING DATA CORRECTLY!")
 
+
 if __name__ == "__main__":
-    test_grok_cached_extraction()
+    pytest.main([__file__])
@@ -2,23 +2,35 @@
 Rate limiting utilities for API calls.
 """
 
+import asyncio
+import logging
+import re
+import threading
 import time
-from collections import defaultdict
 from typing import Dict
 
+logger = logging.getLogger(__name__)
+
 
 class RateLimiter:
-    """Rate limiter to prevent hitting API rate limits"""
-    
+    """Token-bucket rate limiter to prevent hitting API rate limits.
+
+    Each provider gets a bucket that refills continuously at its
+    configured rate and holds up to one second's worth of tokens. A burst
+    after an idle period spends the accumulated tokens immediately instead
+    of sleeping a fixed gap between every call; only once the bucket is
+    empty do callers wait for the refill.
+    """
+
     def __init__(self, custom_intervals: Dict[str, float] = None):
         """
         Initialize rate limiter.
-        
+
         Args:
             custom_intervals: Custom minimum intervals per provider
+                (seconds between calls; the bucket refill rate is derived
+                as 1/interval)
         """
-        self.last_call = defaultdict(float)
-        
         # Default minimum intervals between calls (seconds)
         self.min_intervals = {
             'openai': 0.1,      # 10 calls/second
@@ -26,49 +38,191 @@ class RateLimiter:
             'anthropic': 0.2,   # 5 calls/second
             'grok': 0.1         # 10 calls/second
         }
-        
+
         # Update with custom intervals if provided
         if custom_intervals:
             self.min_intervals.update(custom_intervals)
-    
+
+        # Per-provider bucket state: (tokens, last_refill_timestamp).
+        # Buckets are created full on first use so startup bursts don't wait.
+        self._buckets: Dict[str, tuple] = {}
+        # Per-call caches: provider-name normalization and the derived
+        # (rate, capacity) pair, so the hot path skips the string
+        # allocation and the divisions
+        self._key_cache: Dict[str, str] = {}
+        self._rate_cache: Dict[str, tuple] = {}
+        # Concurrent callers share bucket state; one lock per provider
+        # keeps the read-refill-spend sequence atomic without making
+        # callers of different providers contend on each other. The init
+        # lock only guards lazy creation of the per-provider locks.
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_init_lock = threading.Lock()
+
+    def _capacity(self, interval: float) -> float:
+        """Bucket capacity for an interval: one second's worth of calls"""
+        return max(1.0, 1.0 / interval)
+
+    def _reserve(self, provider: str) -> float:
+        """
+        Spend (or schedule) one token for a call; return seconds to sleep.
+
+        Shared by the sync and async entry points: all bucket accounting
+        happens here under the lock, and the caller performs whichever
+        kind of sleep suits it.
+        """
+        key = self._key_cache.get(provider)
+        if key is None:
+            key = self._key_cache.setdefault(provider, provider.lower())
+        provider = key
+
+        cached = self._rate_cache.get(provider)
+        if cached is None:
+            interval = self.min_intervals.get(provider, 0.1)
+            cached = self._rate_cache.setdefault(
+                provider, (1.0 / interval, self._capacity(interval)))
+        rate, capacity = cached
+
+        lock = self._locks.get(provider)
+        if lock is None:
+            with self._locks_init_lock:
+                lock = self._locks.setdefault(provider, threading.Lock())
+
+        with lock:
+            # Monotonic clock: NTP steps or DST shifts in wall time would
+            # otherwise refill buckets spuriously or stall callers
+            now = time.monotonic()
+            tokens, last_refill = self._buckets.get(provider, (capacity, now))
+            tokens = min(capacity, tokens + (now - last_refill) * rate)
+            if tokens >= 1.0:
+                # Spend a token and go straight through
+                self._buckets[provider] = (tokens - 1.0, now)
+                sleep_time = 0.0
+            else:
+                # Bucket is empty: sleep until the next token accrues and
+                # leave the bucket drained
+                sleep_time = (1.0 - tokens) / rate
+                self._buckets[provider] = (0.0, now + sleep_time)
+
+        if sleep_time > 0.0:
+            # Lazy %-formatting: when DEBUG is off this costs one level
+            # check instead of building a string and taking the stdout lock
+            logger.debug("Rate limiting: waiting %.2fs for %s", sleep_time, provider)
+        return sleep_time
+
     def wait_if_needed(self, provider: str):
         """
         Wait if necessary to respect rate limits.
-        
+
         Args:
             provider: Provider name (openai, gemini, anthropic, grok)
         """
-        provider = provider.lower()
-        now = time.time()
-        last = self.last_call[provider]
-        min_interval = self.min_intervals.get(provider, 0.1)
-        
-        time_since_last = now - last
-        if time_since_last < min_interval:
-            sleep_time = min_interval - time_since_last
-            print(f"Rate limiting: waiting {sleep_time:.2f}s for {provider}")
+        sleep_time = self._reserve(provider)
+        if sleep_time > 0.0:
             time.sleep(sleep_time)
-        
-        self.last_call[provider] = time.time()
-    
+
+    async def await_if_needed(self, provider: str):
+        """
+        Async variant of wait_if_needed: yields to the event loop while
+        waiting, so a rate-limited provider never stalls the others'
+        coroutines.
+
+        Args:
+            provider: Provider name (openai, gemini, anthropic, grok)
+        """
+        sleep_time = self._reserve(provider)
+        if sleep_time > 0.0:
+            await asyncio.sleep(sleep_time)
+
+    @staticmethod
+    def _parse_reset(value: str) -> float:
+        """
+        Seconds until the request budget resets, from a header value.
+
+        Providers format this either as plain seconds ("12.5") or as a
+        compact duration ("1s", "250ms", "6m30s"). Returns 0.0 when the
+        value is unparseable.
+        """
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            pass
+        total = 0.0
+        matched = False
+        for amount, unit in re.findall(r'([\d.]+)\s*(ms|s|m|h)', value or ''):
+            try:
+                total += float(amount) * {'ms': 0.001, 's': 1.0, 'm': 60.0, 'h': 3600.0}[unit]
+                matched = True
+            except ValueError:
+                return 0.0
+        return total if matched else 0.0
+
+    def observe(self, provider: str, headers) -> None:
+        """
+        Self-tune a provider's interval from its rate-limit headers.
+
+        OpenAI-protocol providers advertise the remaining request budget
+        and the time until it resets; spreading the remaining budget over
+        that window replaces the conservative hardcoded interval with the
+        server's actual ceiling. Headers that are absent or unparseable
+        leave the configured interval untouched.
+
+        This is opt-in library surface: the built-in clients stream
+        through the SDKs' high-level helpers, which don't expose response
+        headers, so nothing calls this automatically. Callers that fetch
+        responses via the SDKs' raw-response mode (or their own HTTP
+        layer) feed the headers in themselves after each call.
+
+        Args:
+            provider: Provider name
+            headers: Mapping of response headers (case-insensitive keys
+                are the caller's responsibility; httpx headers already are)
+        """
+        remaining = headers.get('x-ratelimit-remaining-requests')
+        reset = headers.get('x-ratelimit-reset-requests')
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining = int(remaining)
+        except (TypeError, ValueError):
+            return
+        reset_seconds = self._parse_reset(reset)
+        if reset_seconds <= 0.0:
+            return
+        # Spread what's left of the budget over the window; with nothing
+        # remaining, wait out the whole window before the next call
+        self.set_interval(provider, reset_seconds / max(remaining, 1))
+
     def set_interval(self, provider: str, interval: float):
         """
         Set custom interval for a provider.
-        
+
         Args:
             provider: Provider name
             interval: Minimum interval in seconds
         """
-        self.min_intervals[provider.lower()] = interval
-    
+        provider = provider.lower()
+        self.min_intervals[provider] = interval
+        # Drop the derived-rate cache entry so the next call recomputes
+        self._rate_cache.pop(provider, None)
+
     def reset(self, provider: str = None):
         """
         Reset rate limiting state.
-        
+
         Args:
             provider: Specific provider to reset, or None for all
         """
         if provider:
-            self.last_call.pop(provider.lower(), None)
+            provider = provider.lower()
+            lock = self._locks.get(provider)
+            if lock is not None:
+                with lock:
+                    self._buckets.pop(provider, None)
+            else:
+                self._buckets.pop(provider, None)
         else:
-            self.last_call.clear()
\ No newline at end of file
+            with self._locks_init_lock:
+                for key, lock in self._locks.items():
+                    with lock:
+                        self._buckets.pop(key, None)
+                self._buckets.clear()
@@ -2,43 +2,70 @@
 Retry utilities with exponential backoff.
 """
 
+import logging
 import time
 import random
 from functools import wraps
 from typing import Callable, Any
 
+logger = logging.getLogger(__name__)
 
-def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 60.0):
+
+def retry_with_backoff(max_retries: int = 3, base_delay: float = 1.0, max_delay: float = 60.0,
+                       retry_on: tuple = None, retry_if: Callable[[BaseException], bool] = None):
     """
     Decorator for retrying functions with exponential backoff.
-    
+
+    Only transient failures are worth the backoff sleeps; deterministic
+    errors (auth failures, bad requests, our own bugs) re-raise
+    immediately instead of burning the whole retry budget.
+
     Args:
         max_retries: Maximum number of retry attempts
         base_delay: Base delay in seconds
         max_delay: Maximum delay in seconds
+        retry_on: Exception classes to retry (default: RetryableError,
+            ConnectionError, TimeoutError)
+        retry_if: Optional predicate consulted for retry_on matches; return
+            False to re-raise without retrying
     """
+    if retry_on is None:
+        retry_on = (RetryableError, ConnectionError, TimeoutError)
+
+    # The delay cap per attempt is fixed by the decorator arguments, so
+    # compute the whole schedule once at decoration time; 1 << i is the
+    # small-int power of two without the generic exponentiation path
+    delay_caps = tuple(min(base_delay * (1 << i), max_delay) for i in range(max_retries))
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             last_exception = None
-            
+
             for attempt in range(max_retries + 1):  # +1 for initial attempt
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except NonRetryableError:
+                    raise
+                except retry_on as e:
+                    if retry_if is not None and not retry_if(e):
+                        raise
                     last_exception = e
-                    
+
                     # Don't retry on the last attempt
                     if attempt == max_retries:
                         break
                     
-                    # Calculate delay with exponential backoff and jitter
-                    delay = min(base_delay * (2 ** attempt), max_delay)
-                    jitter = random.uniform(0, delay * 0.1)  # Add up to 10% jitter
-                    total_delay = delay + jitter
+                    # Full-jitter backoff: sleep a uniform draw from
+                    # [0, cap) rather than cap plus a token jitter, so
+                    # many retriers hitting the same failure decorrelate
+                    # instead of stampeding in lockstep
+                    total_delay = random.random() * delay_caps[attempt]
                     
-                    print(f"Attempt {attempt + 1} failed: {str(e)}")
-                    print(f"Retrying in {total_delay:.2f} seconds...")
+                    # Lazy %-formatting keeps the disabled-DEBUG cost to a
+                    # level check instead of string building plus stdout I/O
+                    logger.debug("Attempt %d failed: %s; retrying in %.2f seconds",
+                                 attempt + 1, e, total_delay)
                     time.sleep(total_delay)
             
             # If we get here, all retries failed